@@ -45,6 +45,8 @@ setup(
         "postgresql": ["psycopg2-binary"],
         "mongodb": ["pymongo"],
         "all_databases": ["mysql-connector-python", "psycopg2-binary", "pymongo"],
+        "speedups": ["orjson", "pysimdjson"],
+        "psrp": ["pypsrp"],
         "dev": ["build", "pdoc3", "ruff", "bandit", "radon", "safety"],
     },
     author="Thibault SCIRE",
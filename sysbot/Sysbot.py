@@ -23,6 +23,8 @@ SOFTWARE.
 """
 
 import json
+import threading
+from contextlib import nullcontext
 
 from .utils.engine import ComponentMeta
 from .utils.engine import TunnelingManager
@@ -61,6 +63,7 @@ class Sysbot(metaclass=ComponentMeta):
             components = []
             components.extend([f"modules.{module}" for module in all_modules])
             components.extend([f"plugins.{plugin}" for plugin in all_plugins])
+        self._components = []
         ComponentLoader.load_components(self, components)
         self._cache = Cache("No sessions created")
         self._protocol = None
@@ -152,7 +155,10 @@ class Sysbot(metaclass=ComponentMeta):
                     raise Exception("Failed to open direct session")
                 connection = {"session": session, "tunnels": None}
 
+            # Serializes the commands of non thread-safe connectors
+            connection["lock"] = threading.Lock()
             self._cache.connections.register(connection, alias)
+            self._invalidate_caches(alias)
         except Exception as e:
             for tunnel in reversed(tunnels):
                 tunnel.stop()
@@ -162,6 +168,10 @@ class Sysbot(metaclass=ComponentMeta):
         """
         Execute a command on a remote session.
 
+        This method may be called from several threads. Commands on one
+        session are run one at a time unless its connector is thread-safe
+        (HTTP connectors), commands on different sessions run in parallel.
+
         Args:
             alias: Session alias identifying the connection to use.
             command: Command string to execute on the remote system.
@@ -171,21 +181,27 @@ class Sysbot(metaclass=ComponentMeta):
             Command execution result. The format depends on the protocol used.
 
         Raises:
-            ValueError: If the specified alias does not exist.
+            ValueError: If the specified alias does not exist, or if the
+                connector does not support an execution option.
             RuntimeError: If no valid session is found for the alias.
             Exception: If command execution fails.
         """
         try:
             connection = self._cache.connections.switch(alias)
+        except ValueError as ve:
+            raise ValueError(f"Alias '{alias}' does not exist: {str(ve)}")
+        try:
             if not connection or "session" not in connection:
                 raise RuntimeError(f"No valid session found for alias '{alias}'")
 
-            result = self._protocol.execute_command(
-                connection["session"], command, **kwargs
-            )
+            lock = nullcontext() if self._protocol.THREAD_SAFE else connection["lock"]
+            with lock:
+                result = self._protocol.execute_command(
+                    connection["session"], command, **kwargs
+                )
             return result
-        except ValueError as ve:
-            raise ValueError(f"Alias '{alias}' does not exist: {str(ve)}")
+        except ValueError:
+            raise
         except Exception as e:
             raise Exception(f"Failed to execute command: {str(e)}")
 
@@ -206,6 +222,7 @@ class Sysbot(metaclass=ComponentMeta):
                     for tunnel in reversed(connection["tunnels"]):
                         tunnel.stop()
             self._cache.connections.clear_all()
+            self._invalidate_caches()
         except Exception as e:
             raise Exception(f"Failed to close all sessions: {str(e)}")
 
@@ -222,13 +239,31 @@ class Sysbot(metaclass=ComponentMeta):
         """
         try:
             connection = self._cache.connections.switch(alias)
+        except ValueError as ve:
+            raise ValueError(f"Alias '{alias}' does not exist: {str(ve)}")
+        try:
             if not connection or "session" not in connection:
                 raise RuntimeError(f"No valid session found for alias '{alias}'")
             self._protocol.close_session(connection["session"])
             self._cache.connections.clear(alias)
+            self._invalidate_caches(alias)
         except Exception as e:
             raise Exception(f"Failed to close session: {str(e)}")
 
+    def _invalidate_caches(self, alias: str = None) -> None:
+        """
+        Drop the cached getter results of every loaded component.
+
+        A reopened alias may point to another host, results cached for the
+        previous session must not be served for it.
+
+        Args:
+            alias: Only drop the results of this session alias. If None, drop
+                the results of every alias.
+        """
+        for component in self._components:
+            component.invalidate_cache(alias)
+
     def call_components(self, function_path: str, *args, **kwargs) -> any:
         """
         Dynamically call a function from loaded components.
@@ -11,12 +11,17 @@ import requests
 import hmac
 import hashlib
 import base64
+import threading
 import jwt as jwt_lib
 from datetime import datetime, timedelta, timezone
 from requests.auth import HTTPBasicAuth
 from requests_oauthlib import OAuth1, OAuth2Session
 from sysbot.utils.engine import ConnectorInterface
 
+# Guards the lazy creation of pooled clients, commands of one HTTP session
+# may run on several threads at once
+_CLIENT_LOCK = threading.Lock()
+
 # Whitelist of allowed hash algorithms for HMAC
 ALLOWED_HASH_ALGORITHMS = {
     "sha1": hashlib.sha1,
@@ -34,6 +39,10 @@ class BaseHttp(ConnectorInterface):
     This class should not be used directly but extended by authentication-specific classes.
     """
 
+    # Requests only share the pooled requests.Session, which is safe to use
+    # from several threads
+    THREAD_SAFE = True
+
     def __init__(self, port=443, use_https=True):
         """
         Initialize base HTTP connector.
@@ -61,7 +70,40 @@ class BaseHttp(ConnectorInterface):
         protocol = "https" if self.use_https else "http"
         return f"{protocol}://{host}:{port}{endpoint}"
 
-    def _make_request(self, method, url, auth=None, headers=None, params=None, data=None, json=None, verify=True):
+    def _get_client(self, session):
+        """
+        Get the pooled HTTP client bound to a session, creating it on first use.
+
+        Reusing a single requests.Session per connection keeps the underlying
+        TCP/TLS connections alive between calls instead of paying a new
+        handshake for every request.
+
+        Args:
+            session (dict): Session configuration.
+
+        Returns:
+            requests.Session: The HTTP client of the session.
+        """
+        client = session.get("client")
+        if client is None:
+            with _CLIENT_LOCK:
+                client = session.get("client")
+                if client is None:
+                    client = session["client"] = requests.Session()
+        return client
+
+    def _close_client(self, session):
+        """
+        Close the pooled HTTP client of a session, if any.
+
+        Args:
+            session (dict): Session configuration.
+        """
+        client = session.pop("client", None)
+        if client is not None:
+            client.close()
+
+    def _make_request(self, method, url, auth=None, headers=None, params=None, data=None, json=None, verify=True, session=None):
         """
         Make an HTTP request with error handling.
 
@@ -74,6 +116,8 @@ class BaseHttp(ConnectorInterface):
             data: Request body data.
             json: JSON request body.
             verify (bool): Whether to verify SSL certificates (default: True).
+            session (dict): Optional session configuration whose pooled client
+                is used to send the request (default: one-shot request).
 
         Returns:
             requests.Response: The response object.
@@ -81,8 +125,9 @@ class BaseHttp(ConnectorInterface):
         Raises:
             Exception: If the request fails.
         """
+        client = self._get_client(session) if session is not None else requests
         try:
-            response = requests.request(
+            response = client.request(
                 method=method.upper(),
                 url=url,
                 auth=auth,
@@ -182,19 +227,20 @@ class Apikey(BaseHttp):
             params=params,
             data=data,
             json=json_data,
-            verify=verify
+            verify=verify,
+            session=session
         )
         
         return response.content
 
     def close_session(self, session):
         """
-        Close the session (no-op for API key auth).
+        Close the session and release its pooled HTTP connections.
 
         Args:
             session (dict): Session configuration.
         """
-        pass
+        self._close_client(session)
 
 
 class Basicauth(BaseHttp):
@@ -273,19 +319,20 @@ class Basicauth(BaseHttp):
             params=params,
             data=data,
             json=json_data,
-            verify=verify
+            verify=verify,
+            session=session
         )
         
         return response.content
 
     def close_session(self, session):
         """
-        Close the session (no-op for Basic auth).
+        Close the session and release its pooled HTTP connections.
 
         Args:
             session (dict): Session configuration.
         """
-        pass
+        self._close_client(session)
 
 
 class Oauth1(BaseHttp):
@@ -377,19 +424,20 @@ class Oauth1(BaseHttp):
             params=params,
             data=data,
             json=json_data,
-            verify=verify
+            verify=verify,
+            session=session
         )
         
         return response.content
 
     def close_session(self, session):
         """
-        Close the session (no-op for OAuth 1.0).
+        Close the session and release its pooled HTTP connections.
 
         Args:
             session (dict): Session configuration.
         """
-        pass
+        self._close_client(session)
 
 
 class Oauth2(BaseHttp):
@@ -494,19 +542,20 @@ class Oauth2(BaseHttp):
             params=params,
             data=data,
             json=json_data,
-            verify=verify
+            verify=verify,
+            session=session
         )
         
         return response.content
 
     def close_session(self, session):
         """
-        Close the session (no-op for OAuth 2.0).
+        Close the session and release its pooled HTTP connections.
 
         Args:
             session (dict): Session configuration.
         """
-        pass
+        self._close_client(session)
 
 
 class Jwt(BaseHttp):
@@ -601,19 +650,20 @@ class Jwt(BaseHttp):
             params=params,
             data=data,
             json=json_data,
-            verify=verify
+            verify=verify,
+            session=session
         )
         
         return response.content
 
     def close_session(self, session):
         """
-        Close the session (no-op for JWT).
+        Close the session and release its pooled HTTP connections.
 
         Args:
             session (dict): Session configuration.
         """
-        pass
+        self._close_client(session)
 
 
 class Saml(BaseHttp):
@@ -691,19 +741,20 @@ class Saml(BaseHttp):
             params=params,
             data=data,
             json=json_data,
-            verify=verify
+            verify=verify,
+            session=session
         )
         
         return response.content
 
     def close_session(self, session):
         """
-        Close the session (no-op for SAML).
+        Close the session and release its pooled HTTP connections.
 
         Args:
             session (dict): Session configuration.
         """
-        pass
+        self._close_client(session)
 
 
 class Hmac(BaseHttp):
@@ -846,19 +897,20 @@ class Hmac(BaseHttp):
             params=params,
             data=data,
             json=json_data,
-            verify=verify
+            verify=verify,
+            session=session
         )
         
         return response.content
 
     def close_session(self, session):
         """
-        Close the session (no-op for HMAC).
+        Close the session and release its pooled HTTP connections.
 
         Args:
             session (dict): Session configuration.
         """
-        pass
+        self._close_client(session)
 
 
 class Certificate(BaseHttp):
@@ -943,7 +995,7 @@ class Certificate(BaseHttp):
             verify = True
         
         try:
-            response = requests.request(
+            response = self._get_client(session).request(
                 method=method.upper(),
                 url=url,
                 cert=cert,
@@ -960,12 +1012,12 @@ class Certificate(BaseHttp):
 
     def close_session(self, session):
         """
-        Close the session (no-op for certificate auth).
+        Close the session and release its pooled HTTP connections.
 
         Args:
             session (dict): Session configuration.
         """
-        pass
+        self._close_client(session)
 
 
 class Openidconnect(BaseHttp):
@@ -1078,16 +1130,17 @@ class Openidconnect(BaseHttp):
             params=params,
             data=data,
             json=json_data,
-            verify=verify
+            verify=verify,
+            session=session
         )
         
         return response.content
 
     def close_session(self, session):
         """
-        Close the session (no-op for OpenID Connect).
+        Close the session and release its pooled HTTP connections.
 
         Args:
             session (dict): Session configuration.
         """
-        pass
+        self._close_client(session)
@@ -219,7 +219,7 @@ $credential = New-Object System.Management.Automation.PSCredential('{username}',
 
             # Execute the command locally
             result = subprocess.run(
-                [shell_exe, "-encodedcommand", encoded_command],
+                [shell_exe, "-NoProfile", "-NonInteractive", "-encodedcommand", encoded_command],
                 capture_output=True,
                 text=True
             )
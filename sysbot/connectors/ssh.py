@@ -11,6 +11,7 @@ import base64
 from netmiko import ConnectHandler
 from netmiko.ssh_autodetect import SSHDetect
 from sysbot.utils.engine import ConnectorInterface
+from sysbot.utils.helper import UTF8_OUTPUT_PREAMBLE
 
 
 class Bash(ConnectorInterface):
@@ -197,12 +198,14 @@ $credential = New-Object System.Management.Automation.PSCredential('{username}',
             else:
                 final_command = command
 
+            # stdout is decoded as UTF-8 below, make PowerShell produce it
+            final_command = UTF8_OUTPUT_PREAMBLE + final_command
             encoded_command = base64.b64encode(
                 final_command.encode("utf_16_le")
             ).decode("ascii")
 
             stdin, stdout, stderr = session.exec_command(
-                "powershell.exe -encodedcommand {0}".format(encoded_command),
+                "powershell.exe -NoProfile -NonInteractive -encodedcommand {0}".format(encoded_command),
                 get_pty=False,
             )
             stdin.close()
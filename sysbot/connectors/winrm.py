@@ -8,6 +8,15 @@ the pywinrm library for establishing and managing sessions.
 from winrm.protocol import Protocol
 from base64 import b64encode
 from sysbot.utils.engine import ConnectorInterface
+from sysbot.utils.helper import UTF8_OUTPUT_PREAMBLE
+
+# pypsrp is optional, it is only needed by the persistent Runspace connector
+try:
+    from pypsrp.powershell import PowerShell, RunspacePool
+    from pypsrp.wsman import WSMan
+    HAS_PYPSRP = True
+except ImportError:
+    HAS_PYPSRP = False
 
 
 class Powershell(ConnectorInterface):
@@ -75,7 +84,7 @@ class Powershell(ConnectorInterface):
             password (str): Password for elevated execution (if required)
 
         Returns:
-            str: The output of the command.
+            bytes: The UTF-8 encoded output of the command.
 
         Raises:
             Exception: If there is an error executing the command.
@@ -103,12 +112,13 @@ $credential = New-Object System.Management.Automation.PSCredential('{username}',
             else:
                 final_command = command
 
+            final_command = UTF8_OUTPUT_PREAMBLE + final_command
             encoded_command = b64encode(final_command.encode("utf_16_le")).decode(
                 "ascii"
             )
             payload = session["protocol"].run_command(
                 session["shell"],
-                "powershell -encodedcommand {0}".format(encoded_command),
+                "powershell -NoProfile -NonInteractive -encodedcommand {0}".format(encoded_command),
             )
             stdout, stderr, status_code = session["protocol"].get_command_output(
                 session["shell"], payload
@@ -132,3 +142,136 @@ $credential = New-Object System.Management.Automation.PSCredential('{username}',
             session["protocol"].close_shell(session["shell"])
         except Exception as e:
             raise Exception(f"Failed to close WinRM session: {str(e)}")
+
+
+class Runspace(ConnectorInterface):
+    """
+    This class runs PowerShell commands over WinRM in a persistent runspace
+    using the PowerShell Remoting Protocol (pypsrp).
+
+    Unlike the Powershell connector, no powershell.exe process is started per
+    command: the runspace is opened once per session, so modules imported and
+    variables set by one command stay available to the next ones.
+    """
+
+    def __init__(self, port=5986):
+        """
+        Initialize WinRM runspace connector with default port.
+
+        Args:
+            port (int): Default WinRM HTTPS port (default: 5986).
+        """
+        super().__init__()
+        self.default_port = port
+
+    def open_session(
+        self,
+        host,
+        port=None,
+        login=None,
+        password=None,
+        ssl=True,
+        auth="negotiate",
+        cert_validation=True,
+    ):
+        """
+        Opens a WinRM connection and a runspace on a Windows system.
+
+        Args:
+            host (str): Hostname or IP address of the Windows system.
+            port (int): Port of the WinRM service. If None, uses default_port.
+            login (str): Username for the session.
+            password (str): Password for the session.
+            ssl (bool): Connect over HTTPS (default: True).
+            auth (str): Authentication method: negotiate, ntlm, kerberos,
+                basic, certificate or credssp (default: negotiate).
+            cert_validation (bool or str): Validate the server certificate,
+                or path to a CA bundle to validate it against (default: True).
+
+        Returns:
+            dict: A dictionary containing the WSMan connection and runspace pool.
+
+        Raises:
+            ImportError: If pypsrp is not installed.
+            Exception: If there is an error opening the session.
+        """
+        if not HAS_PYPSRP:
+            raise ImportError(
+                "pypsrp is required for persistent runspaces. Install it with: pip install pypsrp"
+            )
+        if port is None:
+            port = self.default_port
+        wsman = None
+        try:
+            wsman = WSMan(
+                host,
+                port=port,
+                username=login,
+                password=password,
+                ssl=ssl,
+                auth=auth,
+                cert_validation=cert_validation,
+            )
+            pool = RunspacePool(wsman, no_profile=True)
+            pool.open()
+            return {"wsman": wsman, "pool": pool}
+        except Exception as e:
+            if wsman is not None:
+                try:
+                    wsman.close()
+                except Exception:
+                    pass
+            raise Exception(f"Failed to open WinRM runspace: {str(e)}")
+
+    def execute_command(
+        self, session, command, runas=False, username=None, password=None
+    ):
+        """
+        Executes a PowerShell script in the session runspace.
+
+        Args:
+            session (dict): The session dictionary containing the runspace pool.
+            command (str): The PowerShell script to execute.
+            runas (bool): Elevated execution, not supported in a runspace.
+            username (str): Username for elevated execution, only used with runas.
+            password (str): Password for elevated execution, only used with runas.
+
+        Returns:
+            str: The output objects of the script, one per line.
+
+        Raises:
+            ValueError: If runas is requested.
+            Exception: If there is an error executing the command, or if the
+                script wrote to its error stream.
+        """
+        if runas:
+            raise ValueError(
+                "runas is not supported by the Runspace connector, "
+                "open the session with the Powershell connector instead"
+            )
+        try:
+            ps = PowerShell(session["pool"])
+            ps.add_script(command)
+            output = ps.invoke()
+        except Exception as e:
+            raise Exception(f"Failed to execute command: {str(e)}")
+        if ps.had_errors:
+            errors = "\n".join(str(error) for error in ps.streams.error)
+            raise Exception(f"Failed to execute command: {errors or 'the script reported an error'}")
+        return "\n".join(str(item) for item in output)
+
+    def close_session(self, session):
+        """
+        Closes the runspace and the WinRM connection.
+
+        Args:
+            session (dict): The session dictionary containing the runspace pool.
+
+        Raises:
+            Exception: If there is an error closing the session.
+        """
+        try:
+            session["pool"].close()
+            session["wsman"].close()
+        except Exception as e:
+            raise Exception(f"Failed to close WinRM runspace: {str(e)}")
@@ -5,8 +5,21 @@ This module provides methods for managing VMware Cloud Foundation through SDDC
 Manager, including hosts, clusters, domains, workload domains, and lifecycle
 management using the SDDC Manager REST API.
 """
-from sysbot.utils.engine import ComponentBase
-import json
+from types import MappingProxyType
+from sysbot.utils.engine import (
+    ComponentBase,
+    json_lazy,
+    json_loads,
+    json_pointer,
+    ttl_cache,
+    url_segment,
+)
+
+# Shared read-only request options, avoids building a dict on every call
+_GET = MappingProxyType({"method": "GET"})
+
+# Topology changes on the order of days, cache it for 30 minutes
+TOPOLOGY_TTL = 1800
 
 
 class Sddcmanager(ComponentBase):
@@ -16,7 +29,72 @@ class Sddcmanager(ComponentBase):
     This module uses the SDDC Manager REST API directly.
     Requires an HTTP session with Basic Auth or other authentication method.
     """
-    
+
+    # Endpoint templates of the getters taking an identifier
+    _URLS = {
+        "host": "/v1/hosts/%s",
+        "domain": "/v1/domains/%s",
+        "cluster": "/v1/clusters/%s",
+        "vcenter": "/v1/vcenters/%s",
+        "nsxt_cluster": "/v1/nsxt-clusters/%s",
+        "task": "/v1/tasks/%s",
+    }
+
+    def _get(self, alias: str, path: str, **kwargs):
+        """
+        Issue a GET request against the SDDC Manager API.
+
+        Args:
+            alias: Session alias for the connection.
+            path: API path, e.g. "/v1/hosts".
+            **kwargs: Additional command execution options; "options" is
+                merged over the GET defaults.
+
+        Returns:
+            Raw response body.
+        """
+        options = {**_GET, **kwargs["options"]} if kwargs.get("options") else _GET
+        return self.execute_command(alias, path, options=options)
+
+    @staticmethod
+    def _as_list(output) -> list:
+        """
+        Decode a collection response into a list.
+
+        Args:
+            output: Raw response body.
+
+        Returns:
+            The "elements" of the response, the decoded list, or the decoded
+            object wrapped in a list. Empty list for an empty or
+            whitespace-only body.
+        """
+        # isspace() checks in place, unlike strip() it allocates nothing
+        if not output or output.isspace():
+            return []
+        result = json_loads(output)
+        # API returns {"elements": [...]}
+        if isinstance(result, dict):
+            return result.get("elements", [result])
+        return result or []
+
+    @staticmethod
+    def _as_dict(output, lazy: bool = False) -> dict:
+        """
+        Decode a single-object response.
+
+        Args:
+            output: Raw response body.
+            lazy: Return a lazily decoded simdjson object instead of a dict.
+
+        Returns:
+            The decoded object, or an empty dictionary for an empty or
+            whitespace-only body.
+        """
+        if not output or output.isspace():
+            return {}
+        return json_lazy(output) if lazy else json_loads(output)
+
     def get_hosts(self, alias: str, **kwargs) -> list:
         """
         Get all hosts managed by SDDC Manager.
@@ -28,41 +106,49 @@ class Sddcmanager(ComponentBase):
         Returns:
             List of dictionaries containing host information.
         """
-        options = {"method": "GET"}
-        options.update(kwargs.get("options", {}))
-        output = self.execute_command(alias, "/v1/hosts", options=options)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # API returns {"elements": [...]}
-        if isinstance(result, dict) and "elements" in result:
-            return result["elements"]
-        return result if isinstance(result, list) else [result]
+        return self._as_list(self._get(alias, "/v1/hosts", **kwargs))
 
-    def get_host(self, alias: str, host_id: str, **kwargs) -> dict:
+    def get_host(self, alias: str, host_id: str, lazy: bool = False, **kwargs) -> dict:
         """
         Get a specific host by ID.
 
         Args:
             alias: Session alias for the connection.
             host_id: Host identifier.
+            lazy: Return a simdjson object proxy that decodes fields on
+                access (requires pysimdjson, see json_lazy).
             **kwargs: Additional command execution options.
 
         Returns:
             Dictionary containing detailed host information.
         """
-        options = {"method": "GET"}
-        options.update(kwargs.get("options", {}))
-        output = self.execute_command(alias, f"/v1/hosts/{host_id}", options=options)
-        if not output or output.strip() == "":
-            return {}
-        result = json.loads(output)
-        return result
+        return self._as_dict(self._get(alias, self._URLS["host"] % url_segment(host_id), **kwargs), lazy)
+
+    def get_hosts_bulk(self, alias: str, host_ids: list, max_workers: int = 8, **kwargs) -> list:
+        """
+        Get several hosts by ID concurrently.
+
+        Args:
+            alias: Session alias for the connection.
+            host_ids: Host identifiers.
+            max_workers: Maximum number of concurrent requests (default: 8).
+            **kwargs: Additional command execution options.
+
+        Returns:
+            List of dictionaries containing detailed host information,
+            in the same order as host_ids.
+        """
+        return self._run_concurrently(
+            lambda host_id: self.get_host(alias, host_id, **kwargs), host_ids, max_workers
+        )
 
+    @ttl_cache(TOPOLOGY_TTL)
     def get_domains(self, alias: str, **kwargs) -> list:
         """
         Get all workload domains.
 
+        Cached for 30 minutes, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
             **kwargs: Additional command execution options.
@@ -70,36 +156,41 @@ class Sddcmanager(ComponentBase):
         Returns:
             List of dictionaries containing workload domain information.
         """
-        options = {"method": "GET"}
-        options.update(kwargs.get("options", {}))
-        output = self.execute_command(alias, "/v1/domains", options=options)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # API returns {"elements": [...]}
-        if isinstance(result, dict) and "elements" in result:
-            return result["elements"]
-        return result if isinstance(result, list) else [result]
+        return self._as_list(self._get(alias, "/v1/domains", **kwargs))
 
-    def get_domain(self, alias: str, domain_id: str, **kwargs) -> dict:
+    def get_domain(self, alias: str, domain_id: str, lazy: bool = False, **kwargs) -> dict:
         """
         Get a specific workload domain by ID.
 
         Args:
             alias: Session alias for the connection.
             domain_id: Workload domain identifier.
+            lazy: Return a simdjson object proxy that decodes fields on
+                access (requires pysimdjson, see json_lazy).
             **kwargs: Additional command execution options.
 
         Returns:
             Dictionary containing detailed workload domain information.
         """
-        options = {"method": "GET"}
-        options.update(kwargs.get("options", {}))
-        output = self.execute_command(alias, f"/v1/domains/{domain_id}", options=options)
-        if not output or output.strip() == "":
-            return {}
-        result = json.loads(output)
-        return result
+        return self._as_dict(self._get(alias, self._URLS["domain"] % url_segment(domain_id), **kwargs), lazy)
+
+    def get_domains_bulk(self, alias: str, domain_ids: list, max_workers: int = 8, **kwargs) -> list:
+        """
+        Get several workload domains by ID concurrently.
+
+        Args:
+            alias: Session alias for the connection.
+            domain_ids: Workload domain identifiers.
+            max_workers: Maximum number of concurrent requests (default: 8).
+            **kwargs: Additional command execution options.
+
+        Returns:
+            List of dictionaries containing detailed workload domain information,
+            in the same order as domain_ids.
+        """
+        return self._run_concurrently(
+            lambda domain_id: self.get_domain(alias, domain_id, **kwargs), domain_ids, max_workers
+        )
 
     def get_clusters(self, alias: str, **kwargs) -> list:
         """
@@ -112,41 +203,49 @@ class Sddcmanager(ComponentBase):
         Returns:
             List of dictionaries containing cluster information.
         """
-        options = {"method": "GET"}
-        options.update(kwargs.get("options", {}))
-        output = self.execute_command(alias, "/v1/clusters", options=options)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # API returns {"elements": [...]}
-        if isinstance(result, dict) and "elements" in result:
-            return result["elements"]
-        return result if isinstance(result, list) else [result]
+        return self._as_list(self._get(alias, "/v1/clusters", **kwargs))
 
-    def get_cluster(self, alias: str, cluster_id: str, **kwargs) -> dict:
+    def get_cluster(self, alias: str, cluster_id: str, lazy: bool = False, **kwargs) -> dict:
         """
         Get a specific cluster by ID.
 
         Args:
             alias: Session alias for the connection.
             cluster_id: Cluster identifier.
+            lazy: Return a simdjson object proxy that decodes fields on
+                access (requires pysimdjson, see json_lazy).
             **kwargs: Additional command execution options.
 
         Returns:
             Dictionary containing detailed cluster information.
         """
-        options = {"method": "GET"}
-        options.update(kwargs.get("options", {}))
-        output = self.execute_command(alias, f"/v1/clusters/{cluster_id}", options=options)
-        if not output or output.strip() == "":
-            return {}
-        result = json.loads(output)
-        return result
+        return self._as_dict(self._get(alias, self._URLS["cluster"] % url_segment(cluster_id), **kwargs), lazy)
+
+    def get_clusters_bulk(self, alias: str, cluster_ids: list, max_workers: int = 8, **kwargs) -> list:
+        """
+        Get several clusters by ID concurrently.
+
+        Args:
+            alias: Session alias for the connection.
+            cluster_ids: Cluster identifiers.
+            max_workers: Maximum number of concurrent requests (default: 8).
+            **kwargs: Additional command execution options.
+
+        Returns:
+            List of dictionaries containing detailed cluster information,
+            in the same order as cluster_ids.
+        """
+        return self._run_concurrently(
+            lambda cluster_id: self.get_cluster(alias, cluster_id, **kwargs), cluster_ids, max_workers
+        )
 
+    @ttl_cache(TOPOLOGY_TTL)
     def get_vcenters(self, alias: str, **kwargs) -> list:
         """
         Get all vCenter Server instances.
 
+        Cached for 30 minutes, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
             **kwargs: Additional command execution options.
@@ -154,36 +253,23 @@ class Sddcmanager(ComponentBase):
         Returns:
             List of dictionaries containing vCenter Server information.
         """
-        options = {"method": "GET"}
-        options.update(kwargs.get("options", {}))
-        output = self.execute_command(alias, "/v1/vcenters", options=options)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # API returns {"elements": [...]}
-        if isinstance(result, dict) and "elements" in result:
-            return result["elements"]
-        return result if isinstance(result, list) else [result]
+        return self._as_list(self._get(alias, "/v1/vcenters", **kwargs))
 
-    def get_vcenter(self, alias: str, vcenter_id: str, **kwargs) -> dict:
+    def get_vcenter(self, alias: str, vcenter_id: str, lazy: bool = False, **kwargs) -> dict:
         """
         Get a specific vCenter Server by ID.
 
         Args:
             alias: Session alias for the connection.
             vcenter_id: vCenter Server identifier.
+            lazy: Return a simdjson object proxy that decodes fields on
+                access (requires pysimdjson, see json_lazy).
             **kwargs: Additional command execution options.
 
         Returns:
             Dictionary containing detailed vCenter Server information.
         """
-        options = {"method": "GET"}
-        options.update(kwargs.get("options", {}))
-        output = self.execute_command(alias, f"/v1/vcenters/{vcenter_id}", options=options)
-        if not output or output.strip() == "":
-            return {}
-        result = json.loads(output)
-        return result
+        return self._as_dict(self._get(alias, self._URLS["vcenter"] % url_segment(vcenter_id), **kwargs), lazy)
 
     def get_nsxt_clusters(self, alias: str, **kwargs) -> list:
         """
@@ -196,36 +282,23 @@ class Sddcmanager(ComponentBase):
         Returns:
             List of dictionaries containing NSX-T cluster information.
         """
-        options = {"method": "GET"}
-        options.update(kwargs.get("options", {}))
-        output = self.execute_command(alias, "/v1/nsxt-clusters", options=options)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # API returns {"elements": [...]}
-        if isinstance(result, dict) and "elements" in result:
-            return result["elements"]
-        return result if isinstance(result, list) else [result]
+        return self._as_list(self._get(alias, "/v1/nsxt-clusters", **kwargs))
 
-    def get_nsxt_cluster(self, alias: str, cluster_id: str, **kwargs) -> dict:
+    def get_nsxt_cluster(self, alias: str, cluster_id: str, lazy: bool = False, **kwargs) -> dict:
         """
         Get a specific NSX-T cluster by ID.
 
         Args:
             alias: Session alias for the connection.
             cluster_id: NSX-T cluster identifier.
+            lazy: Return a simdjson object proxy that decodes fields on
+                access (requires pysimdjson, see json_lazy).
             **kwargs: Additional command execution options.
 
         Returns:
             Dictionary containing detailed NSX-T cluster information.
         """
-        options = {"method": "GET"}
-        options.update(kwargs.get("options", {}))
-        output = self.execute_command(alias, f"/v1/nsxt-clusters/{cluster_id}", options=options)
-        if not output or output.strip() == "":
-            return {}
-        result = json.loads(output)
-        return result
+        return self._as_dict(self._get(alias, self._URLS["nsxt_cluster"] % url_segment(cluster_id), **kwargs), lazy)
 
     def get_credentials(self, alias: str, **kwargs) -> list:
         """
@@ -238,21 +311,15 @@ class Sddcmanager(ComponentBase):
         Returns:
             List of dictionaries containing credential information.
         """
-        options = {"method": "GET"}
-        options.update(kwargs.get("options", {}))
-        output = self.execute_command(alias, "/v1/credentials", options=options)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # API returns {"elements": [...]}
-        if isinstance(result, dict) and "elements" in result:
-            return result["elements"]
-        return result if isinstance(result, list) else [result]
+        return self._as_list(self._get(alias, "/v1/credentials", **kwargs))
 
+    @ttl_cache(TOPOLOGY_TTL)
     def get_sddc_manager(self, alias: str, **kwargs) -> dict:
         """
         Get SDDC Manager details.
 
+        Cached for 30 minutes, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
             **kwargs: Additional command execution options.
@@ -260,16 +327,17 @@ class Sddcmanager(ComponentBase):
         Returns:
             Dictionary containing SDDC Manager information.
         """
-        options = {"method": "GET"}
-        options.update(kwargs.get("options", {}))
-        output = self.execute_command(alias, "/v1/sddc-managers", options=options)
-        if not output or output.strip() == "":
+        output = self._get(alias, "/v1/sddc-managers", **kwargs)
+        if not output or output.isspace():
             return {}
-        result = json.loads(output)
-        # If result has elements, return the first one
+        # Only decode the first element when the API returns {"elements": [...]}
+        document = json_lazy(output)
+        manager = json_pointer(document, "/elements/0")
+        if manager is not None:
+            return manager
+        result = json_pointer(document, "")
         if isinstance(result, dict) and "elements" in result:
-            elements = result["elements"]
-            return elements[0] if elements else {}
+            return {}
         return result
 
     def get_tasks(self, alias: str, **kwargs) -> list:
@@ -283,36 +351,41 @@ class Sddcmanager(ComponentBase):
         Returns:
             List of dictionaries containing task information.
         """
-        options = {"method": "GET"}
-        options.update(kwargs.get("options", {}))
-        output = self.execute_command(alias, "/v1/tasks", options=options)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # API returns {"elements": [...]}
-        if isinstance(result, dict) and "elements" in result:
-            return result["elements"]
-        return result if isinstance(result, list) else [result]
+        return self._as_list(self._get(alias, "/v1/tasks", **kwargs))
 
-    def get_task(self, alias: str, task_id: str, **kwargs) -> dict:
+    def get_task(self, alias: str, task_id: str, lazy: bool = False, **kwargs) -> dict:
         """
         Get a specific task by ID.
 
         Args:
             alias: Session alias for the connection.
             task_id: Task identifier.
+            lazy: Return a simdjson object proxy that decodes fields on
+                access (requires pysimdjson, see json_lazy).
             **kwargs: Additional command execution options.
 
         Returns:
             Dictionary containing detailed task information.
         """
-        options = {"method": "GET"}
-        options.update(kwargs.get("options", {}))
-        output = self.execute_command(alias, f"/v1/tasks/{task_id}", options=options)
-        if not output or output.strip() == "":
-            return {}
-        result = json.loads(output)
-        return result
+        return self._as_dict(self._get(alias, self._URLS["task"] % url_segment(task_id), **kwargs), lazy)
+
+    def get_tasks_bulk(self, alias: str, task_ids: list, max_workers: int = 8, **kwargs) -> list:
+        """
+        Get several tasks by ID concurrently.
+
+        Args:
+            alias: Session alias for the connection.
+            task_ids: Task identifiers.
+            max_workers: Maximum number of concurrent requests (default: 8).
+            **kwargs: Additional command execution options.
+
+        Returns:
+            List of dictionaries containing detailed task information,
+            in the same order as task_ids.
+        """
+        return self._run_concurrently(
+            lambda task_id: self.get_task(alias, task_id, **kwargs), task_ids, max_workers
+        )
 
     def get_ntp(self, alias: str, **kwargs) -> dict:
         """
@@ -325,13 +398,7 @@ class Sddcmanager(ComponentBase):
         Returns:
             Dictionary containing NTP configuration.
         """
-        options = {"method": "GET"}
-        options.update(kwargs.get("options", {}))
-        output = self.execute_command(alias, "/v1/system/ntp-configuration", options=options)
-        if not output or output.strip() == "":
-            return {}
-        result = json.loads(output)
-        return result
+        return self._as_dict(self._get(alias, "/v1/system/ntp-configuration", **kwargs))
 
     def get_dns(self, alias: str, **kwargs) -> dict:
         """
@@ -344,13 +411,7 @@ class Sddcmanager(ComponentBase):
         Returns:
             Dictionary containing DNS configuration.
         """
-        options = {"method": "GET"}
-        options.update(kwargs.get("options", {}))
-        output = self.execute_command(alias, "/v1/system/dns-configuration", options=options)
-        if not output or output.strip() == "":
-            return {}
-        result = json.loads(output)
-        return result
+        return self._as_dict(self._get(alias, "/v1/system/dns-configuration", **kwargs))
 
     def get_version(self, alias: str, **kwargs) -> dict:
         """
@@ -363,13 +424,7 @@ class Sddcmanager(ComponentBase):
         Returns:
             Dictionary containing version information.
         """
-        options = {"method": "GET"}
-        options.update(kwargs.get("options", {}))
-        output = self.execute_command(alias, "/v1/system/version", options=options)
-        if not output or output.strip() == "":
-            return {}
-        result = json.loads(output)
-        return result
+        return self._as_dict(self._get(alias, "/v1/system/version", **kwargs))
 
     def get_vcf_services(self, alias: str, **kwargs) -> list:
         """
@@ -382,16 +437,7 @@ class Sddcmanager(ComponentBase):
         Returns:
             List of dictionaries containing VCF service status information.
         """
-        options = {"method": "GET"}
-        options.update(kwargs.get("options", {}))
-        output = self.execute_command(alias, "/v1/vcf-services", options=options)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # API returns {"elements": [...]}
-        if isinstance(result, dict) and "elements" in result:
-            return result["elements"]
-        return result if isinstance(result, list) else [result]
+        return self._as_list(self._get(alias, "/v1/vcf-services", **kwargs))
 
     def get_ldap(self, alias: str, **kwargs) -> dict:
         """
@@ -404,13 +450,7 @@ class Sddcmanager(ComponentBase):
         Returns:
             Dictionary containing LDAP configuration.
         """
-        options = {"method": "GET"}
-        options.update(kwargs.get("options", {}))
-        output = self.execute_command(alias, "/v1/system/ldap-configuration", options=options)
-        if not output or output.strip() == "":
-            return {}
-        result = json.loads(output)
-        return result
+        return self._as_dict(self._get(alias, "/v1/system/ldap-configuration", **kwargs))
 
     def get_syslog(self, alias: str, **kwargs) -> dict:
         """
@@ -423,10 +463,4 @@ class Sddcmanager(ComponentBase):
         Returns:
             Dictionary containing syslog configuration.
         """
-        options = {"method": "GET"}
-        options.update(kwargs.get("options", {}))
-        output = self.execute_command(alias, "/v1/system/syslog-configuration", options=options)
-        if not output or output.strip() == "":
-            return {}
-        result = json.loads(output)
-        return result
+        return self._as_dict(self._get(alias, "/v1/system/syslog-configuration", **kwargs))
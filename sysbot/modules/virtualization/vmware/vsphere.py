@@ -5,8 +5,15 @@ This module provides methods for managing VMware vSphere environments including
 virtual machines, hosts, datastores, clusters, and resource pools using the
 vCenter REST API. Requires HTTP session with Basic authentication.
 """
-from sysbot.utils.engine import ComponentBase
-import json
+from types import MappingProxyType
+from sysbot.utils.engine import ComponentBase, json_loads, json_pointer, ttl_cache, url_segment
+
+# Shared read-only request options, avoids building a dict on every call
+_GET = MappingProxyType({"method": "GET"})
+_POST = MappingProxyType({"method": "POST"})
+
+# Topology changes on the order of days, cache it for 30 minutes
+TOPOLOGY_TTL = 1800
 
 
 class Vsphere(ComponentBase):
@@ -15,6 +22,21 @@ class Vsphere(ComponentBase):
     Requires a session opened with protocol="http", product="basicauth".
     """
 
+    # Endpoint templates of the getters taking an identifier
+    _URLS = {
+        "vm": "/rest/vcenter/vm/%s",
+        "vm_power": "/rest/vcenter/vm/%s/power",
+        "vm_power_start": "/rest/vcenter/vm/%s/power/start",
+        "vm_power_stop": "/rest/vcenter/vm/%s/power/stop",
+        "vm_power_reset": "/rest/vcenter/vm/%s/power/reset",
+        "vm_power_suspend": "/rest/vcenter/vm/%s/power/suspend",
+        "host": "/rest/vcenter/host/%s",
+        "datastore": "/rest/vcenter/datastore/%s",
+        "cluster": "/rest/vcenter/cluster/%s",
+        "network": "/rest/vcenter/network/%s",
+        "datacenter": "/rest/vcenter/datacenter/%s",
+    }
+
     def list_vms(self, alias: str, **kwargs) -> list:
         """
         List all virtual machines in vCenter.
@@ -26,9 +48,9 @@ class Vsphere(ComponentBase):
             list: List of VM objects with basic information.
         """
         output = self.execute_command(
-            alias, "/rest/vcenter/vm", options={"method": "GET"}, **kwargs
+            alias, "/rest/vcenter/vm", options=_GET, **kwargs
         )
-        result = json.loads(output)
+        result = json_loads(output)
         return result.get("value", [])
 
     def get_vm(self, alias: str, vm_id: str, **kwargs) -> dict:
@@ -43,11 +65,29 @@ class Vsphere(ComponentBase):
             dict: VM detailed information.
         """
         output = self.execute_command(
-            alias, f"/rest/vcenter/vm/{vm_id}", options={"method": "GET"}, **kwargs
+            alias, self._URLS["vm"] % url_segment(vm_id), options=_GET, **kwargs
         )
-        result = json.loads(output)
+        result = json_loads(output)
         return result.get("value", {})
 
+    def get_vms_bulk(
+        self, alias: str, vm_ids: list, max_workers: int = 8, **kwargs
+    ) -> list:
+        """
+        Get detailed information about several virtual machines concurrently.
+
+        Args:
+            alias (str): Session alias.
+            vm_ids (list): Virtual machine identifiers.
+            max_workers (int): Maximum number of concurrent requests (default: 8).
+
+        Returns:
+            list: VM detailed information, in the same order as vm_ids.
+        """
+        return self._run_concurrently(
+            lambda vm_id: self.get_vm(alias, vm_id, **kwargs), vm_ids, max_workers
+        )
+
     def get_vm_power_state(self, alias: str, vm_id: str, **kwargs) -> str:
         """
         Get the power state of a virtual machine.
@@ -61,12 +101,11 @@ class Vsphere(ComponentBase):
         """
         output = self.execute_command(
             alias,
-            f"/rest/vcenter/vm/{vm_id}/power",
-            options={"method": "GET"},
+            self._URLS["vm_power"] % url_segment(vm_id),
+            options=_GET,
             **kwargs,
         )
-        result = json.loads(output)
-        return result.get("value", {}).get("state", "")
+        return json_pointer(output, "/value/state", "")
 
     def power_on_vm(self, alias: str, vm_id: str, **kwargs) -> dict:
         """
@@ -81,12 +120,12 @@ class Vsphere(ComponentBase):
         """
         output = self.execute_command(
             alias,
-            f"/rest/vcenter/vm/{vm_id}/power/start",
-            options={"method": "POST"},
+            self._URLS["vm_power_start"] % url_segment(vm_id),
+            options=_POST,
             **kwargs,
         )
         if output:
-            return json.loads(output)
+            return json_loads(output)
         return {}
 
     def power_off_vm(self, alias: str, vm_id: str, **kwargs) -> dict:
@@ -102,12 +141,12 @@ class Vsphere(ComponentBase):
         """
         output = self.execute_command(
             alias,
-            f"/rest/vcenter/vm/{vm_id}/power/stop",
-            options={"method": "POST"},
+            self._URLS["vm_power_stop"] % url_segment(vm_id),
+            options=_POST,
             **kwargs,
         )
         if output:
-            return json.loads(output)
+            return json_loads(output)
         return {}
 
     def reset_vm(self, alias: str, vm_id: str, **kwargs) -> dict:
@@ -123,12 +162,12 @@ class Vsphere(ComponentBase):
         """
         output = self.execute_command(
             alias,
-            f"/rest/vcenter/vm/{vm_id}/power/reset",
-            options={"method": "POST"},
+            self._URLS["vm_power_reset"] % url_segment(vm_id),
+            options=_POST,
             **kwargs,
         )
         if output:
-            return json.loads(output)
+            return json_loads(output)
         return {}
 
     def suspend_vm(self, alias: str, vm_id: str, **kwargs) -> dict:
@@ -144,12 +183,12 @@ class Vsphere(ComponentBase):
         """
         output = self.execute_command(
             alias,
-            f"/rest/vcenter/vm/{vm_id}/power/suspend",
-            options={"method": "POST"},
+            self._URLS["vm_power_suspend"] % url_segment(vm_id),
+            options=_POST,
             **kwargs,
         )
         if output:
-            return json.loads(output)
+            return json_loads(output)
         return {}
 
     def list_hosts(self, alias: str, **kwargs) -> list:
@@ -163,9 +202,9 @@ class Vsphere(ComponentBase):
             list: List of host objects.
         """
         output = self.execute_command(
-            alias, "/rest/vcenter/host", options={"method": "GET"}, **kwargs
+            alias, "/rest/vcenter/host", options=_GET, **kwargs
         )
-        result = json.loads(output)
+        result = json_loads(output)
         return result.get("value", [])
 
     def get_host(self, alias: str, host_id: str, **kwargs) -> dict:
@@ -180,11 +219,31 @@ class Vsphere(ComponentBase):
             dict: Host detailed information.
         """
         output = self.execute_command(
-            alias, f"/rest/vcenter/host/{host_id}", options={"method": "GET"}, **kwargs
+            alias, self._URLS["host"] % url_segment(host_id), options=_GET, **kwargs
         )
-        result = json.loads(output)
+        result = json_loads(output)
         return result.get("value", {})
 
+    def get_hosts_bulk(
+        self, alias: str, host_ids: list, max_workers: int = 8, **kwargs
+    ) -> list:
+        """
+        Get detailed information about several hosts concurrently.
+
+        Args:
+            alias (str): Session alias.
+            host_ids (list): Host identifiers.
+            max_workers (int): Maximum number of concurrent requests (default: 8).
+
+        Returns:
+            list: Host detailed information, in the same order as host_ids.
+        """
+        return self._run_concurrently(
+            lambda host_id: self.get_host(alias, host_id, **kwargs),
+            host_ids,
+            max_workers,
+        )
+
     def list_datastores(self, alias: str, **kwargs) -> list:
         """
         List all datastores in vCenter.
@@ -196,9 +255,9 @@ class Vsphere(ComponentBase):
             list: List of datastore objects.
         """
         output = self.execute_command(
-            alias, "/rest/vcenter/datastore", options={"method": "GET"}, **kwargs
+            alias, "/rest/vcenter/datastore", options=_GET, **kwargs
         )
-        result = json.loads(output)
+        result = json_loads(output)
         return result.get("value", [])
 
     def get_datastore(self, alias: str, datastore_id: str, **kwargs) -> dict:
@@ -214,17 +273,20 @@ class Vsphere(ComponentBase):
         """
         output = self.execute_command(
             alias,
-            f"/rest/vcenter/datastore/{datastore_id}",
-            options={"method": "GET"},
+            self._URLS["datastore"] % url_segment(datastore_id),
+            options=_GET,
             **kwargs,
         )
-        result = json.loads(output)
+        result = json_loads(output)
         return result.get("value", {})
 
+    @ttl_cache(TOPOLOGY_TTL)
     def list_clusters(self, alias: str, **kwargs) -> list:
         """
         List all clusters in vCenter.
 
+        Cached for 30 minutes, see ttl_cache.
+
         Args:
             alias (str): Session alias.
 
@@ -232,9 +294,9 @@ class Vsphere(ComponentBase):
             list: List of cluster objects.
         """
         output = self.execute_command(
-            alias, "/rest/vcenter/cluster", options={"method": "GET"}, **kwargs
+            alias, "/rest/vcenter/cluster", options=_GET, **kwargs
         )
-        result = json.loads(output)
+        result = json_loads(output)
         return result.get("value", [])
 
     def get_cluster(self, alias: str, cluster_id: str, **kwargs) -> dict:
@@ -250,17 +312,20 @@ class Vsphere(ComponentBase):
         """
         output = self.execute_command(
             alias,
-            f"/rest/vcenter/cluster/{cluster_id}",
-            options={"method": "GET"},
+            self._URLS["cluster"] % url_segment(cluster_id),
+            options=_GET,
             **kwargs,
         )
-        result = json.loads(output)
+        result = json_loads(output)
         return result.get("value", {})
 
+    @ttl_cache(TOPOLOGY_TTL)
     def list_networks(self, alias: str, **kwargs) -> list:
         """
         List all networks in vCenter.
 
+        Cached for 30 minutes, see ttl_cache.
+
         Args:
             alias (str): Session alias.
 
@@ -268,9 +333,9 @@ class Vsphere(ComponentBase):
             list: List of network objects.
         """
         output = self.execute_command(
-            alias, "/rest/vcenter/network", options={"method": "GET"}, **kwargs
+            alias, "/rest/vcenter/network", options=_GET, **kwargs
         )
-        result = json.loads(output)
+        result = json_loads(output)
         return result.get("value", [])
 
     def get_network(self, alias: str, network_id: str, **kwargs) -> dict:
@@ -286,17 +351,20 @@ class Vsphere(ComponentBase):
         """
         output = self.execute_command(
             alias,
-            f"/rest/vcenter/network/{network_id}",
-            options={"method": "GET"},
+            self._URLS["network"] % url_segment(network_id),
+            options=_GET,
             **kwargs,
         )
-        result = json.loads(output)
+        result = json_loads(output)
         return result.get("value", {})
 
+    @ttl_cache(TOPOLOGY_TTL)
     def list_datacenters(self, alias: str, **kwargs) -> list:
         """
         List all datacenters in vCenter.
 
+        Cached for 30 minutes, see ttl_cache.
+
         Args:
             alias (str): Session alias.
 
@@ -304,9 +372,9 @@ class Vsphere(ComponentBase):
             list: List of datacenter objects.
         """
         output = self.execute_command(
-            alias, "/rest/vcenter/datacenter", options={"method": "GET"}, **kwargs
+            alias, "/rest/vcenter/datacenter", options=_GET, **kwargs
         )
-        result = json.loads(output)
+        result = json_loads(output)
         return result.get("value", [])
 
     def get_datacenter(self, alias: str, datacenter_id: str, **kwargs) -> dict:
@@ -322,11 +390,11 @@ class Vsphere(ComponentBase):
         """
         output = self.execute_command(
             alias,
-            f"/rest/vcenter/datacenter/{datacenter_id}",
-            options={"method": "GET"},
+            self._URLS["datacenter"] % url_segment(datacenter_id),
+            options=_GET,
             **kwargs,
         )
-        result = json.loads(output)
+        result = json_loads(output)
         return result.get("value", {})
 
     def get_version(self, alias: str, **kwargs) -> dict:
@@ -340,9 +408,9 @@ class Vsphere(ComponentBase):
             dict: Version information including product, type, version, build, and release date.
         """
         output = self.execute_command(
-            alias, "/rest/appliance/system/version", options={"method": "GET"}, **kwargs
+            alias, "/rest/appliance/system/version", options=_GET, **kwargs
         )
-        result = json.loads(output)
+        result = json_loads(output)
         return result.get("value", {})
 
     def get_utc_datetime(self, alias: str, **kwargs) -> str:
@@ -356,9 +424,9 @@ class Vsphere(ComponentBase):
             str: Current UTC date and time in ISO 8601 format.
         """
         output = self.execute_command(
-            alias, "/rest/appliance/system/time", options={"method": "GET"}, **kwargs
+            alias, "/rest/appliance/system/time", options=_GET, **kwargs
         )
-        result = json.loads(output)
+        result = json_loads(output)
         return result.get("value", {}).get("date", "")
 
     def get_timezone(self, alias: str, **kwargs) -> str:
@@ -374,8 +442,8 @@ class Vsphere(ComponentBase):
         output = self.execute_command(
             alias,
             "/rest/appliance/system/time/timezone",
-            options={"method": "GET"},
+            options=_GET,
             **kwargs,
         )
-        result = json.loads(output)
+        result = json_loads(output)
         return result.get("value", "")
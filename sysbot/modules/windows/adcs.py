@@ -5,17 +5,22 @@ This module provides methods for managing and querying Active Directory Certific
 Services (AD CS) including Certificate Authorities, issued certificates, templates,
 and PKI operations using PowerShell ADCS cmdlets.
 """
-from sysbot.utils.engine import ComponentBase
-import json
+from sysbot.utils.engine import ComponentBase, ttl_cache
+
+# CA, template and CRL results returned with cache=True are at most this old
+TOPOLOGY_TTL = 60
 
 
 class Adcs(ComponentBase):
     """Active Directory Certificate Services management class using PowerShell ADCS cmdlets."""
 
+    @ttl_cache(TOPOLOGY_TTL, opt_in=True)
     def get_ca(self, alias: str, **kwargs) -> dict:
         """
         Get Certificate Authority information.
 
+        Pass cache=True to accept a result up to 60 seconds old, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
             **kwargs: Additional command execution options.
@@ -23,16 +28,16 @@ class Adcs(ComponentBase):
         Returns:
             Dictionary containing CA information including Name, Type, ConfigString, and Certificate.
         """
-        command = "Get-CertificationAuthority | Select-Object Name, Type, ConfigString, Certificate | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return {}
-        return json.loads(output)
+        command = "Get-CertificationAuthority | Select-Object Name, Type, ConfigString, Certificate | ConvertTo-Json -Compress"
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
 
+    @ttl_cache(TOPOLOGY_TTL, opt_in=True)
     def get_ca_property(self, alias: str, **kwargs) -> dict:
         """
         Get Certificate Authority properties.
 
+        Pass cache=True to accept a result up to 60 seconds old, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
             **kwargs: Additional command execution options.
@@ -40,11 +45,8 @@ class Adcs(ComponentBase):
         Returns:
             Dictionary containing CA properties.
         """
-        command = "Get-CAProperty | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return {}
-        return json.loads(output)
+        command = "Get-CAProperty | ConvertTo-Json -Compress"
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
 
     def get_issued_certificates(self, alias: str, **kwargs) -> list:
         """
@@ -57,15 +59,25 @@ class Adcs(ComponentBase):
         Returns:
             List of dictionaries containing issued certificate information.
         """
-        command = "Get-IssuedRequest | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
+        command = "Get-IssuedRequest | ConvertTo-Json -Compress"
+        return self._json_list(self.execute_command(alias, command, **kwargs))
+
+    def iter_issued_certificates(self, alias: str, **kwargs):
+        """
+        Iterate over issued certificates, decoding one certificate at a time.
+
+        PowerShell serializes each request on its own line, so only the record
+        being processed is held as Python objects instead of the whole list.
+
+        Args:
+            alias: Session alias for the connection.
+            **kwargs: Additional command execution options.
+
+        Yields:
+            Dictionaries containing issued certificate information.
+        """
+        command = "Get-IssuedRequest | ForEach-Object { $_ | ConvertTo-Json -Compress }"
+        yield from self._iter_json_lines(self.execute_command(alias, command, **kwargs))
 
     def get_pending_requests(self, alias: str, **kwargs) -> list:
         """
@@ -78,15 +90,8 @@ class Adcs(ComponentBase):
         Returns:
             List of dictionaries containing pending certificate request information.
         """
-        command = "Get-PendingRequest | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
+        command = "Get-PendingRequest | ConvertTo-Json -Compress"
+        return self._json_list(self.execute_command(alias, command, **kwargs))
 
     def get_failed_requests(self, alias: str, **kwargs) -> list:
         """
@@ -99,20 +104,16 @@ class Adcs(ComponentBase):
         Returns:
             List of dictionaries containing failed certificate request information.
         """
-        command = "Get-FailedRequest | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
+        command = "Get-FailedRequest | ConvertTo-Json -Compress"
+        return self._json_list(self.execute_command(alias, command, **kwargs))
 
+    @ttl_cache(TOPOLOGY_TTL, opt_in=True)
     def get_certificate_templates(self, alias: str, **kwargs) -> list:
         """
         Get certificate templates.
 
+        Pass cache=True to accept a result up to 60 seconds old, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
             **kwargs: Additional command execution options.
@@ -120,20 +121,16 @@ class Adcs(ComponentBase):
         Returns:
             List of dictionaries containing certificate template information.
         """
-        command = "Get-CATemplate | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
+        command = "Get-CATemplate | ConvertTo-Json -Compress"
+        return self._json_list(self.execute_command(alias, command, **kwargs))
 
+    @ttl_cache(TOPOLOGY_TTL, opt_in=True)
     def get_crl(self, alias: str, **kwargs) -> dict:
         """
         Get Certificate Revocation List information.
 
+        Pass cache=True to accept a result up to 60 seconds old, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
             **kwargs: Additional command execution options.
@@ -141,11 +138,8 @@ class Adcs(ComponentBase):
         Returns:
             Dictionary containing CRL distribution point information.
         """
-        command = "Get-CACrlDistributionPoint | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return {}
-        return json.loads(output)
+        command = "Get-CACrlDistributionPoint | ConvertTo-Json -Compress"
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
 
     def get_certificate(self, alias: str, request_id: int, **kwargs) -> dict:
         """
@@ -159,11 +153,8 @@ class Adcs(ComponentBase):
         Returns:
             Dictionary containing certificate information for the specified request ID.
         """
-        command = f"Get-IssuedRequest -RequestId {request_id} | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return {}
-        return json.loads(output)
+        command = f"Get-IssuedRequest -RequestId {int(request_id)} | ConvertTo-Json -Compress"
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
 
     def get_revoked_certificates(self, alias: str, **kwargs) -> list:
         """
@@ -176,12 +167,5 @@ class Adcs(ComponentBase):
         Returns:
             List of dictionaries containing revoked certificate information.
         """
-        command = "Get-RevokedRequest | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
+        command = "Get-RevokedRequest | ConvertTo-Json -Compress"
+        return self._json_list(self.execute_command(alias, command, **kwargs))
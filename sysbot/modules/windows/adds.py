@@ -5,17 +5,168 @@ This module provides methods for managing and querying Active Directory Domain
 Services (AD DS) including domains, forests, domain controllers, users, groups,
 computers, and organizational units using PowerShell AD cmdlets.
 """
-from sysbot.utils.engine import ComponentBase
-import json
+from sysbot.utils.engine import ComponentBase, ttl_cache
+from sysbot.utils.helper import Windows
+
+# Domain, forest, DC and GPO results returned with cache=True are at most this old
+TOPOLOGY_TTL = 60
 
 
 class Adds(ComponentBase):
     """Active Directory Domain Services management class using PowerShell AD cmdlets."""
 
+    # PowerShell expressions fetched by bulk(), list results are forced to arrays
+    _BULK_MAP = {
+        "domain": "Get-ADDomain",
+        "forest": "Get-ADForest",
+        "domain_controller": "Get-ADDomainController",
+        "users": "@(Get-ADUser -Filter '*' -Properties *)",
+        "groups": "@(Get-ADGroup -Filter '*' -Properties *)",
+        "organizational_units": "@(Get-ADOrganizationalUnit -Filter '*' -Properties *)",
+        "computers": "@(Get-ADComputer -Filter '*' -Properties *)",
+        "gpos": "@(Get-GPO -All)",
+    }
+
+    @staticmethod
+    def _properties(properties, select=None) -> str:
+        """
+        Build the -Properties argument of the Get-AD* cmdlets.
+
+        Args:
+            properties: Attribute names, or None for all of them.
+            select: Attributes kept in the output, fetched instead of all
+                attributes when properties is None.
+
+        Returns:
+            The -Properties parameter string.
+
+        Raises:
+            ValueError: If an attribute is not a plain property name.
+        """
+        if properties is None:
+            properties = select
+        if properties is None:
+            return "-Properties *"
+        return "-Properties " + Windows.property_list(properties)
+
+    @staticmethod
+    def _select(select) -> str:
+        """
+        Build the Select-Object stage trimming objects before serialization.
+
+        Args:
+            select: Attribute names to keep, or None to keep all of them.
+
+        Returns:
+            The pipeline stage, empty when select is None.
+        """
+        return Windows.select(select)
+
+    @staticmethod
+    def _search(filter: str, ldap_filter: str, search_base: str, page_size: int) -> str:
+        """
+        Build the search scope arguments of the Get-AD* cmdlets.
+
+        Args:
+            filter: PowerShell expression filter, used when ldap_filter is None.
+            ldap_filter: LDAP filter evaluated by the domain controller.
+            search_base: Distinguished name to start the search from.
+            page_size: Number of objects per LDAP page.
+
+        Returns:
+            The search parameters string.
+        """
+        if ldap_filter is not None:
+            search = f"-LDAPFilter {Windows.quote(ldap_filter)}"
+        else:
+            search = f"-Filter {Windows.quote(filter)}"
+        if search_base is not None:
+            search += f" -SearchBase {Windows.quote(search_base)}"
+        if page_size is not None:
+            search += f" -ResultPageSize {int(page_size)}"
+        return search
+
+    def bulk(self, alias: str, keys: list, **kwargs) -> dict:
+        """
+        Get several directory objects in a single PowerShell round-trip.
+
+        Prefer this over calling three or more individual getters in a row.
+
+        Args:
+            alias: Session alias for the connection.
+            keys: Names of the results to fetch, among domain, forest,
+                domain_controller, users, groups, organizational_units,
+                computers and gpos.
+            **kwargs: Additional command execution options.
+
+        Returns:
+            Dictionary mapping each requested key to its result, lists for the
+            plural keys and dictionaries for the others.
+
+        Raises:
+            ValueError: If a key is not supported.
+        """
+        # One extra nesting level for the wrapping hashtable
+        command = Windows.bulk_command(self._BULK_MAP, keys, depth=3)
+        if not keys:
+            return {}
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
+
+    def get_domain_summary(self, alias: str, **kwargs) -> dict:
+        """
+        Get domain, forest and domain controller information in one call.
+
+        FSMO role owners are part of the result: PDCEmulator, RIDMaster and
+        InfrastructureMaster under "domain", SchemaMaster and
+        DomainNamingMaster under "forest".
+
+        Args:
+            alias: Session alias for the connection.
+            **kwargs: Additional command execution options.
+
+        Returns:
+            Dictionary with "domain", "forest" and "domain_controller" keys.
+        """
+        return self.bulk(alias, ["domain", "forest", "domain_controller"], **kwargs)
+
+    def get_inventory(self, alias: str, max_workers: int = 8, **kwargs) -> dict:
+        """
+        Get the domain, forest, domain controller, OUs and GPOs concurrently.
+
+        Each part is fetched by its own getter on a worker thread, see
+        ComponentBase.gather for how commands on one session are scheduled.
+        With cache=True the domain, forest, domain controller and GPOs may be
+        served from the cache.
+
+        Args:
+            alias: Session alias for the connection.
+            max_workers: Maximum number of concurrent commands (default: 8).
+            **kwargs: Additional command execution options.
+
+        Returns:
+            Dictionary keyed by getter name (get_domain, get_forest,
+            get_domain_controller, get_organizational_units, get_gpo).
+        """
+        return self.gather(
+            alias,
+            [
+                "get_domain",
+                "get_forest",
+                "get_domain_controller",
+                "get_organizational_units",
+                "get_gpo",
+            ],
+            max_workers,
+            **kwargs,
+        )
+
+    @ttl_cache(TOPOLOGY_TTL, opt_in=True)
     def get_domain(self, alias: str, **kwargs) -> dict:
         """
         Get domain information.
 
+        Pass cache=True to accept a result up to 60 seconds old, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
             **kwargs: Additional command execution options.
@@ -23,14 +174,16 @@ class Adds(ComponentBase):
         Returns:
             Dictionary containing Active Directory domain information.
         """
-        command = "Get-ADDomain | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        command = "Get-ADDomain | ConvertTo-Json -Compress"
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
 
+    @ttl_cache(TOPOLOGY_TTL, opt_in=True)
     def get_forest(self, alias: str, **kwargs) -> dict:
         """
         Get forest information.
 
+        Pass cache=True to accept a result up to 60 seconds old, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
             **kwargs: Additional command execution options.
@@ -38,14 +191,16 @@ class Adds(ComponentBase):
         Returns:
             Dictionary containing Active Directory forest information.
         """
-        command = "Get-ADForest | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        command = "Get-ADForest | ConvertTo-Json -Compress"
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
 
+    @ttl_cache(TOPOLOGY_TTL, opt_in=True)
     def get_domain_controller(self, alias: str, **kwargs) -> dict:
         """
         Get domain controller information.
 
+        Pass cache=True to accept a result up to 60 seconds old, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
             **kwargs: Additional command execution options.
@@ -53,85 +208,222 @@ class Adds(ComponentBase):
         Returns:
             Dictionary containing domain controller information.
         """
-        command = "Get-ADDomainController | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
-
-    def get_user(self, alias: str, identity: str, **kwargs) -> dict:
+        command = "Get-ADDomainController | ConvertTo-Json -Compress"
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
+
+    def get_user(
+        self,
+        alias: str,
+        identity: str,
+        properties: list = None,
+        select: list = None,
+        **kwargs,
+    ) -> dict:
         """
         Get specific user by identity.
 
         Args:
             alias: Session alias for the connection.
             identity: User identity (username, DN, GUID, or SID).
+            properties: Attribute names to fetch (default: None for all).
+            select: Attributes to keep in the output (default: None for all),
+                also fetched instead of all attributes when properties is None.
             **kwargs: Additional command execution options.
 
         Returns:
-            Dictionary containing user information with all properties.
+            Dictionary containing user information with the requested properties.
         """
-        command = f"Get-ADUser -Identity '{identity}' -Properties * | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
-
-    def get_users(self, alias: str, filter: str = "*", **kwargs) -> list:
+        command = (
+            f"Get-ADUser -Identity {Windows.quote(identity)} "
+            f"{self._properties(properties, select)}{self._select(select)} | ConvertTo-Json -Compress"
+        )
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
+
+    def get_users(
+        self,
+        alias: str,
+        filter: str = "*",
+        properties: list = None,
+        ldap_filter: str = None,
+        search_base: str = None,
+        page_size: int = None,
+        select: list = None,
+        **kwargs,
+    ) -> list:
         """
         Get users matching filter.
 
         Args:
             alias: Session alias for the connection.
             filter: LDAP filter string (default: "*" for all users).
+            properties: Attribute names to fetch (default: None for all).
+            ldap_filter: LDAP filter evaluated by the domain controller, takes
+                precedence over filter (e.g. "(department=Engineering)").
+            search_base: Distinguished name of the container to search in.
+            page_size: Number of objects per LDAP page (default: None for the
+                cmdlet default).
+            select: Attributes to keep in the output (default: None for all).
+                Smaller objects mean less JSON to transfer and decode, at the
+                cost of dropping every other attribute.
             **kwargs: Additional command execution options.
 
         Returns:
             List of dictionaries containing user information.
         """
-        command = f"Get-ADUser -Filter '{filter}' -Properties * | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
+        command = (
+            "ConvertTo-Json -Compress -InputObject "
+            f"@(Get-ADUser {self._search(filter, ldap_filter, search_base, page_size)} "
+            f"{self._properties(properties, select)}{self._select(select)})"
+        )
+        return self._json_list(self.execute_command(alias, command, **kwargs))
+
+    def iter_users(
+        self,
+        alias: str,
+        filter: str = "*",
+        properties: list = None,
+        ldap_filter: str = None,
+        search_base: str = None,
+        page_size: int = None,
+        select: list = None,
+        **kwargs,
+    ):
+        """
+        Iterate over users matching filter, decoding one user at a time.
+
+        PowerShell serializes each user on its own line, so only the record
+        being processed is held as Python objects instead of the whole list.
 
-    def get_group(self, alias: str, identity: str, **kwargs) -> dict:
+        Args:
+            alias: Session alias for the connection.
+            filter: LDAP filter string (default: "*" for all users).
+            properties: Attribute names to fetch (default: None for all).
+            ldap_filter: LDAP filter evaluated by the domain controller, takes
+                precedence over filter (e.g. "(department=Engineering)").
+            search_base: Distinguished name of the container to search in.
+            page_size: Number of objects per LDAP page (default: None for the
+                cmdlet default).
+            select: Attributes to keep in the output (default: None for all).
+                Smaller objects mean less JSON to transfer and decode, at the
+                cost of dropping every other attribute.
+            **kwargs: Additional command execution options.
+
+        Yields:
+            Dictionaries containing user information.
+        """
+        command = (
+            f"Get-ADUser {self._search(filter, ldap_filter, search_base, page_size)} "
+            f"{self._properties(properties, select)}{self._select(select)} "
+            "| ForEach-Object { $_ | ConvertTo-Json -Compress }"
+        )
+        yield from self._iter_json_lines(self.execute_command(alias, command, **kwargs))
+
+    def get_group(
+        self,
+        alias: str,
+        identity: str,
+        properties: list = None,
+        select: list = None,
+        **kwargs,
+    ) -> dict:
         """
         Get specific group by identity.
 
         Args:
             alias: Session alias for the connection.
             identity: Group identity (name, DN, GUID, or SID).
+            properties: Attribute names to fetch (default: None for all).
+            select: Attributes to keep in the output (default: None for all),
+                also fetched instead of all attributes when properties is None.
             **kwargs: Additional command execution options.
 
         Returns:
-            Dictionary containing group information with all properties.
+            Dictionary containing group information with the requested properties.
         """
-        command = f"Get-ADGroup -Identity '{identity}' -Properties * | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
-
-    def get_groups(self, alias: str, filter: str = "*", **kwargs) -> list:
+        command = (
+            f"Get-ADGroup -Identity {Windows.quote(identity)} "
+            f"{self._properties(properties, select)}{self._select(select)} | ConvertTo-Json -Compress"
+        )
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
+
+    def get_groups(
+        self,
+        alias: str,
+        filter: str = "*",
+        properties: list = None,
+        ldap_filter: str = None,
+        search_base: str = None,
+        page_size: int = None,
+        select: list = None,
+        **kwargs,
+    ) -> list:
         """
         Get groups matching filter.
 
         Args:
             alias: Session alias for the connection.
             filter: LDAP filter string (default: "*" for all groups).
+            properties: Attribute names to fetch (default: None for all).
+            ldap_filter: LDAP filter evaluated by the domain controller, takes
+                precedence over filter (e.g. "(department=Engineering)").
+            search_base: Distinguished name of the container to search in.
+            page_size: Number of objects per LDAP page (default: None for the
+                cmdlet default).
+            select: Attributes to keep in the output (default: None for all).
+                Smaller objects mean less JSON to transfer and decode, at the
+                cost of dropping every other attribute.
             **kwargs: Additional command execution options.
 
         Returns:
             List of dictionaries containing group information.
         """
-        command = f"Get-ADGroup -Filter '{filter}' -Properties * | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
+        command = (
+            "ConvertTo-Json -Compress -InputObject "
+            f"@(Get-ADGroup {self._search(filter, ldap_filter, search_base, page_size)} "
+            f"{self._properties(properties, select)}{self._select(select)})"
+        )
+        return self._json_list(self.execute_command(alias, command, **kwargs))
+
+    def iter_groups(
+        self,
+        alias: str,
+        filter: str = "*",
+        properties: list = None,
+        ldap_filter: str = None,
+        search_base: str = None,
+        page_size: int = None,
+        select: list = None,
+        **kwargs,
+    ):
+        """
+        Iterate over groups matching filter, decoding one group at a time.
+
+        PowerShell serializes each group on its own line, so only the record
+        being processed is held as Python objects instead of the whole list.
+
+        Args:
+            alias: Session alias for the connection.
+            filter: LDAP filter string (default: "*" for all groups).
+            properties: Attribute names to fetch (default: None for all).
+            ldap_filter: LDAP filter evaluated by the domain controller, takes
+                precedence over filter (e.g. "(department=Engineering)").
+            search_base: Distinguished name of the container to search in.
+            page_size: Number of objects per LDAP page (default: None for the
+                cmdlet default).
+            select: Attributes to keep in the output (default: None for all).
+                Smaller objects mean less JSON to transfer and decode, at the
+                cost of dropping every other attribute.
+            **kwargs: Additional command execution options.
+
+        Yields:
+            Dictionaries containing group information.
+        """
+        command = (
+            f"Get-ADGroup {self._search(filter, ldap_filter, search_base, page_size)} "
+            f"{self._properties(properties, select)}{self._select(select)} "
+            "| ForEach-Object { $_ | ConvertTo-Json -Compress }"
+        )
+        yield from self._iter_json_lines(self.execute_command(alias, command, **kwargs))
 
     def get_group_members(self, alias: str, identity: str, **kwargs) -> list:
         """
@@ -145,96 +437,181 @@ class Adds(ComponentBase):
         Returns:
             List of dictionaries containing group member information.
         """
-        command = f"Get-ADGroupMember -Identity '{identity}' | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
-
-    def get_organizational_unit(self, alias: str, identity: str, **kwargs) -> dict:
+        command = f"ConvertTo-Json -Compress -InputObject @(Get-ADGroupMember -Identity {Windows.quote(identity)})"
+        return self._json_list(self.execute_command(alias, command, **kwargs))
+
+    def get_organizational_unit(
+        self,
+        alias: str,
+        identity: str,
+        properties: list = None,
+        select: list = None,
+        **kwargs,
+    ) -> dict:
         """
         Get specific organizational unit by identity.
 
         Args:
             alias: Session alias for the connection.
             identity: OU identity (name, DN, or GUID).
+            properties: Attribute names to fetch (default: None for all).
+            select: Attributes to keep in the output (default: None for all),
+                also fetched instead of all attributes when properties is None.
             **kwargs: Additional command execution options.
 
         Returns:
-            Dictionary containing organizational unit information with all properties.
+            Dictionary containing organizational unit information with the requested properties.
         """
-        command = f"Get-ADOrganizationalUnit -Identity '{identity}' -Properties * | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
-
-    def get_organizational_units(self, alias: str, filter: str = "*", **kwargs) -> list:
+        command = (
+            f"Get-ADOrganizationalUnit -Identity {Windows.quote(identity)} "
+            f"{self._properties(properties, select)}{self._select(select)} | ConvertTo-Json -Compress"
+        )
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
+
+    def get_organizational_units(
+        self,
+        alias: str,
+        filter: str = "*",
+        properties: list = None,
+        select: list = None,
+        **kwargs,
+    ) -> list:
         """
         Get organizational units matching filter.
 
         Args:
             alias: Session alias for the connection.
             filter: LDAP filter string (default: "*" for all OUs).
+            properties: Attribute names to fetch (default: None for all).
+            select: Attributes to keep in the output (default: None for all).
+                Smaller objects mean less JSON to transfer and decode, at the
+                cost of dropping every other attribute.
             **kwargs: Additional command execution options.
 
         Returns:
             List of dictionaries containing organizational unit information.
         """
-        command = f"Get-ADOrganizationalUnit -Filter '{filter}' -Properties * | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
-
-    def get_computer(self, alias: str, identity: str, **kwargs) -> dict:
+        command = (
+            "ConvertTo-Json -Compress -InputObject "
+            f"@(Get-ADOrganizationalUnit -Filter {Windows.quote(filter)} "
+            f"{self._properties(properties, select)}{self._select(select)})"
+        )
+        return self._json_list(self.execute_command(alias, command, **kwargs))
+
+    def get_computer(
+        self,
+        alias: str,
+        identity: str,
+        properties: list = None,
+        select: list = None,
+        **kwargs,
+    ) -> dict:
         """
         Get specific computer by identity.
 
         Args:
             alias: Session alias for the connection.
             identity: Computer identity (name, DN, GUID, or SID).
+            properties: Attribute names to fetch (default: None for all).
+            select: Attributes to keep in the output (default: None for all),
+                also fetched instead of all attributes when properties is None.
             **kwargs: Additional command execution options.
 
         Returns:
-            Dictionary containing computer information with all properties.
+            Dictionary containing computer information with the requested properties.
         """
-        command = f"Get-ADComputer -Identity '{identity}' -Properties * | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
-
-    def get_computers(self, alias: str, filter: str = "*", **kwargs) -> list:
+        command = (
+            f"Get-ADComputer -Identity {Windows.quote(identity)} "
+            f"{self._properties(properties, select)}{self._select(select)} | ConvertTo-Json -Compress"
+        )
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
+
+    def get_computers(
+        self,
+        alias: str,
+        filter: str = "*",
+        properties: list = None,
+        ldap_filter: str = None,
+        search_base: str = None,
+        page_size: int = None,
+        select: list = None,
+        **kwargs,
+    ) -> list:
         """
         Get computers matching filter.
 
         Args:
             alias: Session alias for the connection.
             filter: LDAP filter string (default: "*" for all computers).
+            properties: Attribute names to fetch (default: None for all).
+            ldap_filter: LDAP filter evaluated by the domain controller, takes
+                precedence over filter (e.g. "(department=Engineering)").
+            search_base: Distinguished name of the container to search in.
+            page_size: Number of objects per LDAP page (default: None for the
+                cmdlet default).
+            select: Attributes to keep in the output (default: None for all).
+                Smaller objects mean less JSON to transfer and decode, at the
+                cost of dropping every other attribute.
             **kwargs: Additional command execution options.
 
         Returns:
             List of dictionaries containing computer information.
         """
-        command = f"Get-ADComputer -Filter '{filter}' -Properties * | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
+        command = (
+            "ConvertTo-Json -Compress -InputObject "
+            f"@(Get-ADComputer {self._search(filter, ldap_filter, search_base, page_size)} "
+            f"{self._properties(properties, select)}{self._select(select)})"
+        )
+        return self._json_list(self.execute_command(alias, command, **kwargs))
+
+    def iter_computers(
+        self,
+        alias: str,
+        filter: str = "*",
+        properties: list = None,
+        ldap_filter: str = None,
+        search_base: str = None,
+        page_size: int = None,
+        select: list = None,
+        **kwargs,
+    ):
+        """
+        Iterate over computers matching filter, decoding one computer at a time.
+
+        PowerShell serializes each computer on its own line, so only the record
+        being processed is held as Python objects instead of the whole list.
+
+        Args:
+            alias: Session alias for the connection.
+            filter: LDAP filter string (default: "*" for all computers).
+            properties: Attribute names to fetch (default: None for all).
+            ldap_filter: LDAP filter evaluated by the domain controller, takes
+                precedence over filter (e.g. "(department=Engineering)").
+            search_base: Distinguished name of the container to search in.
+            page_size: Number of objects per LDAP page (default: None for the
+                cmdlet default).
+            select: Attributes to keep in the output (default: None for all).
+                Smaller objects mean less JSON to transfer and decode, at the
+                cost of dropping every other attribute.
+            **kwargs: Additional command execution options.
 
+        Yields:
+            Dictionaries containing computer information.
+        """
+        command = (
+            f"Get-ADComputer {self._search(filter, ldap_filter, search_base, page_size)} "
+            f"{self._properties(properties, select)}{self._select(select)} "
+            "| ForEach-Object { $_ | ConvertTo-Json -Compress }"
+        )
+        yield from self._iter_json_lines(self.execute_command(alias, command, **kwargs))
+
+    @ttl_cache(TOPOLOGY_TTL, opt_in=True)
     def get_gpo(self, alias: str, **kwargs) -> list:
         """
         Get all Group Policy Objects.
 
+        Pass cache=True to accept a result up to 60 seconds old, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
             **kwargs: Additional command execution options.
@@ -242,15 +619,8 @@ class Adds(ComponentBase):
         Returns:
             List of dictionaries containing GPO information.
         """
-        command = "Get-GPO -All | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
+        command = "ConvertTo-Json -Compress -InputObject @(Get-GPO -All)"
+        return self._json_list(self.execute_command(alias, command, **kwargs))
 
     def get_gpos(self, alias: str, **kwargs) -> list:
         """
@@ -5,143 +5,278 @@ This module provides methods for managing and querying Windows DNS Server,
 including zones, resource records, forwarders, and DNS server configuration
 using PowerShell DNS Server cmdlets.
 """
-from sysbot.utils.engine import ComponentBase
-import json
+from sysbot.utils.engine import ComponentBase, ttl_cache
+from sysbot.utils.helper import Windows
+
+# Server configuration returned with cache=True is at most this old
+CONFIG_TTL = 60
 
 
 class Dnsserver(ComponentBase):
     """Windows DNS Server management class using PowerShell DNS Server cmdlets."""
 
-    def get_server(self, alias: str, **kwargs) -> dict:
+    # PowerShell expressions fetched by bulk(), list results are forced to arrays
+    _BULK_MAP = {
+        "server": "Get-DnsServer",
+        "zones": "@(Get-DnsServerZone)",
+        "forwarder": "Get-DnsServerForwarder",
+        "cache": "Get-DnsServerCache",
+        "statistics": "Get-DnsServerStatistics",
+        "setting": "Get-DnsServerSetting -All",
+    }
+
+    # ConvertTo-Json depth used by the getter matching each bulk() key
+    _BULK_DEPTH = {
+        "server": 3,
+        "zones": 2,
+        "forwarder": 2,
+        "cache": 2,
+        "statistics": 3,
+        "setting": 3,
+    }
+
+    def bulk(self, alias: str, keys: list, **kwargs) -> dict:
+        """
+        Get several DNS server views in a single PowerShell round-trip.
+
+        Args:
+            alias: Session alias for the connection.
+            keys: Names of the results to fetch, among server, zones,
+                forwarder, cache, statistics and setting.
+            **kwargs: Additional command execution options.
+
+        Returns:
+            Dictionary mapping each requested key to its result, shaped like
+            the result of the matching getter: a list for zones and
+            dictionaries for the others.
+
+        Raises:
+            ValueError: If a key is not supported.
+        """
+        # Each value is serialized at the depth of its individual getter
+        command = Windows.bulk_command(self._BULK_MAP, keys, depth=self._BULK_DEPTH)
+        if not keys:
+            return {}
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
+
+    @ttl_cache(CONFIG_TTL, opt_in=True)
+    def get_server(self, alias: str, select: list = None, **kwargs) -> dict:
         """
         Get DNS server configuration.
 
+        Pass cache=True to accept a result up to 60 seconds old, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
+            select: Properties to keep in the output (default: None for all).
             **kwargs: Additional command execution options.
 
         Returns:
             Dictionary containing DNS server configuration.
         """
-        command = "Get-DnsServer | ConvertTo-Json -Depth 3"
-        output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        command = f"Get-DnsServer{Windows.select(select)} | ConvertTo-Json -Depth 3 -Compress"
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
 
-    def get_zone(self, alias: str, zone_name: str, **kwargs) -> dict:
+    def get_zone(self, alias: str, zone_name: str, select: list = None, **kwargs) -> dict:
         """
         Get specific DNS zone by name.
 
         Args:
             alias: Session alias for the connection.
             zone_name: Name of the DNS zone to retrieve.
+            select: Properties to keep in the output (default: None for all).
             **kwargs: Additional command execution options.
 
         Returns:
             Dictionary containing DNS zone information.
         """
-        command = f"Get-DnsServerZone -Name '{zone_name}' | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        command = (
+            f"Get-DnsServerZone -Name {Windows.quote(zone_name)}"
+            f"{Windows.select(select)} | ConvertTo-Json -Compress"
+        )
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
 
-    def get_zones(self, alias: str, **kwargs) -> list:
+    def get_zones(self, alias: str, select: list = None, **kwargs) -> list:
         """
         Get all DNS zones.
 
         Args:
             alias: Session alias for the connection.
+            select: Properties to keep in the output (default: None for all).
             **kwargs: Additional command execution options.
 
         Returns:
             List of dictionaries containing DNS zone information.
         """
-        command = "Get-DnsServerZone | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
+        command = f"ConvertTo-Json -Compress -InputObject @(Get-DnsServerZone{Windows.select(select)})"
+        return self._json_list(self.execute_command(alias, command, **kwargs))
 
-    def get_resource_records(self, alias: str, zone_name: str, **kwargs) -> list:
+    def get_resource_records(
+        self, alias: str, zone_name: str, compressed: bool = False, **kwargs
+    ) -> list:
         """
         Get all DNS resource records from a zone.
 
         Args:
             alias: Session alias for the connection.
             zone_name: Name of the DNS zone to query.
+            compressed: Gzip the JSON on the remote host before transfer, worth
+                it on zones with many records (default: False).
             **kwargs: Additional command execution options.
 
         Returns:
             List of dictionaries containing DNS resource record information.
         """
-        command = f"Get-DnsServerResourceRecord -ZoneName '{zone_name}' | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
+        command = (
+            "ConvertTo-Json -Compress -InputObject "
+            f"@(Get-DnsServerResourceRecord -ZoneName {Windows.quote(zone_name)})"
+        )
+        if compressed:
+            output = self.execute_command(alias, Windows.gzip_command(command), **kwargs)
+            return self._json_list(Windows.gunzip_output(output))
+        return self._json_list(self.execute_command(alias, command, **kwargs))
+
+    def get_resource_record_table(self, alias: str, zone_name: str, **kwargs) -> dict:
+        """
+        Get the DNS resource records of a zone as columns.
+
+        Each key holds one property of every record, in the same order, which
+        is far lighter to transfer and decode than full record objects on zones
+        with many records, and converts directly to a DataFrame or array.
+
+        Args:
+            alias: Session alias for the connection.
+            zone_name: Name of the DNS zone to query.
+            **kwargs: Additional command execution options.
 
-    def get_forwarder(self, alias: str, **kwargs) -> dict:
+        Returns:
+            Dictionary with the HostName, RecordType, TimeToLive (in seconds)
+            and RecordData lists, RecordData holding the non-empty record data
+            values joined by spaces.
+        """
+        command = (
+            f"$records = @(Get-DnsServerResourceRecord -ZoneName {Windows.quote(zone_name)}); "
+            "ConvertTo-Json -Compress -InputObject ([ordered]@{ "
+            "HostName = @($records | ForEach-Object { $_.HostName }); "
+            "RecordType = @($records | ForEach-Object { $_.RecordType }); "
+            "TimeToLive = @($records | ForEach-Object { $_.TimeToLive.TotalSeconds }); "
+            "RecordData = @($records | ForEach-Object { @($_.RecordData.CimInstanceProperties "
+            "| Where-Object { $null -ne $_.Value } | ForEach-Object { [string]$_.Value }) -join ' ' }) })"
+        )
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
+
+    def get_all_resource_records(self, alias: str, zones: list = None, **kwargs) -> dict:
+        """
+        Get the DNS resource records of several zones in a single call.
+
+        Args:
+            alias: Session alias for the connection.
+            zones: Names of the zones to query (default: None for every zone).
+            **kwargs: Additional command execution options.
+
+        Returns:
+            Dictionary mapping each zone name to its list of resource records.
+        """
+        if zones is None:
+            source = "Get-DnsServerZone"
+        else:
+            names = ",".join(Windows.quote(zone) for zone in zones)
+            source = f"@({names}) | ForEach-Object {{ Get-DnsServerZone -Name $_ }}"
+        command = (
+            "$records = [ordered]@{}; "
+            f"{source} | ForEach-Object {{ "
+            "$records[$_.ZoneName] = @(Get-DnsServerResourceRecord -ZoneName $_.ZoneName) }; "
+            # One extra nesting level for the wrapping hashtable
+            "ConvertTo-Json -Compress -Depth 3 -InputObject $records"
+        )
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
+
+    def iter_resource_records(self, alias: str, zone_name: str, **kwargs):
+        """
+        Iterate over the DNS resource records of a zone, one record at a time.
+
+        PowerShell serializes each record on its own line, so large zones are
+        decoded incrementally instead of as one array.
+
+        Args:
+            alias: Session alias for the connection.
+            zone_name: Name of the DNS zone to query.
+            **kwargs: Additional command execution options.
+
+        Yields:
+            Dictionaries containing DNS resource record information.
+        """
+        command = (
+            f"Get-DnsServerResourceRecord -ZoneName {Windows.quote(zone_name)} "
+            "| ForEach-Object { $_ | ConvertTo-Json -Compress }"
+        )
+        yield from self._iter_json_lines(self.execute_command(alias, command, **kwargs))
+
+    @ttl_cache(CONFIG_TTL, opt_in=True)
+    def get_forwarder(self, alias: str, select: list = None, **kwargs) -> dict:
         """
         Get DNS server forwarders.
 
+        Pass cache=True to accept a result up to 60 seconds old, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
+            select: Properties to keep in the output (default: None for all).
             **kwargs: Additional command execution options.
 
         Returns:
             Dictionary containing DNS forwarder configuration.
         """
-        command = "Get-DnsServerForwarder | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        command = f"Get-DnsServerForwarder{Windows.select(select)} | ConvertTo-Json -Compress"
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
 
-    def get_cache(self, alias: str, **kwargs) -> dict:
+    @ttl_cache(CONFIG_TTL, opt_in=True)
+    def get_cache(self, alias: str, select: list = None, **kwargs) -> dict:
         """
         Get DNS server cache settings.
 
+        Pass cache=True to accept a result up to 60 seconds old, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
+            select: Properties to keep in the output (default: None for all).
             **kwargs: Additional command execution options.
 
         Returns:
             Dictionary containing DNS cache configuration.
         """
-        command = "Get-DnsServerCache | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        command = f"Get-DnsServerCache{Windows.select(select)} | ConvertTo-Json -Compress"
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
 
-    def get_statistics(self, alias: str, **kwargs) -> dict:
+    def get_statistics(self, alias: str, select: list = None, **kwargs) -> dict:
         """
         Get DNS server statistics.
 
         Args:
             alias: Session alias for the connection.
+            select: Properties to keep in the output (default: None for all).
             **kwargs: Additional command execution options.
 
         Returns:
             Dictionary containing DNS server statistics and performance metrics.
         """
-        command = "Get-DnsServerStatistics | ConvertTo-Json -Depth 3"
-        output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        command = f"Get-DnsServerStatistics{Windows.select(select)} | ConvertTo-Json -Depth 3 -Compress"
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
 
-    def get_setting(self, alias: str, **kwargs) -> dict:
+    @ttl_cache(CONFIG_TTL, opt_in=True)
+    def get_setting(self, alias: str, select: list = None, **kwargs) -> dict:
         """
         Get DNS server settings.
 
+        Pass cache=True to accept a result up to 60 seconds old, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
+            select: Properties to keep in the output (default: None for all).
             **kwargs: Additional command execution options.
 
         Returns:
             Dictionary containing all DNS server settings and configuration.
         """
-        command = "Get-DnsServerSetting -All | ConvertTo-Json -Depth 3"
-        output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        command = f"Get-DnsServerSetting -All{Windows.select(select)} | ConvertTo-Json -Depth 3 -Compress"
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
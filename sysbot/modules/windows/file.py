@@ -5,28 +5,70 @@ This module provides comprehensive file system operations for Windows systems,
 including file type checking, attribute retrieval, content operations, and
 ACL (Access Control List) management using PowerShell.
 """
-from sysbot.utils.engine import ComponentBase
-import json
+import hashlib
+
+from sysbot.utils.engine import ComponentBase, json_loads, ttl_cache
+from sysbot.utils.helper import Windows
+
+# Successive checks on one path usually come from a single test step, with
+# cache=True they share one Get-Item probe for a short time
+PROBE_TTL = 2
+
+# Fields returned by attributes()
+ATTRIBUTE_FIELDS = (
+    "Name",
+    "FullName",
+    "Length",
+    "CreationTime",
+    "LastWriteTime",
+    "LastAccessTime",
+    "Attributes",
+    "Extension",
+)
 
 
 class File(ComponentBase):
     """Windows file system operations class using PowerShell."""
 
+    @ttl_cache(PROBE_TTL, opt_in=True)
+    def stat(self, alias: str, path: str, **kwargs) -> list:
+        """
+        Get everything known about a path in a single call.
+
+        is_present, is_file, is_directory, size and attributes all read from
+        this probe. The path may contain wildcards, every matching item is
+        returned. Pass cache=True to accept a probe up to 2 seconds old, see
+        ttl_cache.
+
+        Args:
+            alias: Session alias for the connection.
+            path: Path to query, wildcards allowed.
+            **kwargs: Additional command execution options.
+
+        Returns:
+            One dictionary per matching item containing Name, FullName,
+            Length, CreationTime, LastWriteTime, LastAccessTime, Attributes,
+            Extension and PSIsContainer, empty if the path does not exist.
+        """
+        command = (
+            f"ConvertTo-Json -Compress -InputObject @(Get-Item -Path {Windows.quote(path)} -Force "
+            f"-ErrorAction SilentlyContinue | Select-Object {', '.join(ATTRIBUTE_FIELDS)}, PSIsContainer)"
+        )
+        return self._json_list(self.execute_command(alias, command, **kwargs))
+
     def is_present(self, alias: str, path: str, **kwargs) -> bool:
         """
         Check if a file or directory exists.
 
         Args:
             alias: Session alias for the connection.
-            path: Path to check.
+            path: Path to check, wildcards allowed.
             **kwargs: Additional command execution options.
 
         Returns:
             True if path exists, False otherwise.
         """
-        command = f"""Test-Path -Path '{path}'"""
-        output = self.execute_command(alias, command, **kwargs)
-        return output.strip().lower() == "true"
+        return bool(self.stat(alias, path, **kwargs))
 
     def is_file(self, alias: str, path: str, **kwargs) -> bool:
         """
@@ -34,15 +76,13 @@ class File(ComponentBase):
 
         Args:
             alias: Session alias for the connection.
-            path: Path to check.
+            path: Path to check, wildcards allowed.
             **kwargs: Additional command execution options.
 
         Returns:
-            True if path is a file, False otherwise.
+            True if path is a file, or matches at least one file, False otherwise.
         """
-        command = f"""Test-Path -Path '{path}' -PathType Leaf"""
-        output = self.execute_command(alias, command, **kwargs)
-        return output.strip().lower() == "true"
+        return any(not item["PSIsContainer"] for item in self.stat(alias, path, **kwargs))
 
     def is_directory(self, alias: str, path: str, **kwargs) -> bool:
         """
@@ -50,15 +90,37 @@ class File(ComponentBase):
 
         Args:
             alias: Session alias for the connection.
-            path: Path to check.
+            path: Path to check, wildcards allowed.
             **kwargs: Additional command execution options.
 
         Returns:
-            True if path is a directory, False otherwise.
+            True if path is a directory, or matches at least one directory,
+            False otherwise.
         """
-        command = f"""Test-Path -Path '{path}' -PathType Container"""
-        output = self.execute_command(alias, command, **kwargs)
-        return output.strip().lower() == "true"
+        return any(item["PSIsContainer"] for item in self.stat(alias, path, **kwargs))
+
+    def _item(self, alias: str, path: str, **kwargs) -> dict:
+        """
+        Get the single item a path refers to.
+
+        Args:
+            alias: Session alias for the connection.
+            path: Path to query.
+            **kwargs: Additional command execution options.
+
+        Returns:
+            The stat dictionary of the item.
+
+        Raises:
+            FileNotFoundError: If the path does not exist.
+            ValueError: If the path matches several items.
+        """
+        items = self.stat(alias, path, **kwargs)
+        if not items:
+            raise FileNotFoundError(f"Path not found: {path}")
+        if len(items) > 1:
+            raise ValueError(f"Path matches {len(items)} items: {path}")
+        return items[0]
 
     def size(self, alias: str, path: str, **kwargs) -> str:
         """
@@ -70,10 +132,16 @@ class File(ComponentBase):
             **kwargs: Additional command execution options.
 
         Returns:
-            File size in bytes as a string. Note: Only works with files, not directories.
+            File size in bytes as a string.
+
+        Raises:
+            FileNotFoundError: If the path does not exist.
+            ValueError: If the path is a directory or matches several items.
         """
-        command = f"""(Get-Item -Path '{path}').Length"""
-        return self.execute_command(alias, command, **kwargs)
+        item = self._item(alias, path, **kwargs)
+        if item["PSIsContainer"]:
+            raise ValueError(f"Path is a directory: {path}")
+        return str(item["Length"])
 
     def content(self, alias: str, path: str, **kwargs) -> str:
         """
@@ -87,13 +155,15 @@ class File(ComponentBase):
         Returns:
             File content as a string.
         """
-        command = f"""Get-Content -Path '{path}' -Raw"""
+        command = f"""Get-Content -Path {Windows.quote(path)} -Raw"""
         return self.execute_command(alias, command, **kwargs)
 
     def md5(self, alias: str, path: str, **kwargs) -> str:
         """
         Get MD5 hash of file.
 
+        Deprecated: use sha256, MD5 is kept only for existing test suites.
+
         Args:
             alias: Session alias for the connection.
             path: Path to the file.
@@ -102,9 +172,43 @@ class File(ComponentBase):
         Returns:
             MD5 hash string.
         """
-        command = f"""(Get-FileHash -Path '{path}' -Algorithm MD5).Hash"""
+        command = f"""(Get-FileHash -Path {Windows.quote(path)} -Algorithm MD5).Hash"""
+        return self.execute_command(alias, command, **kwargs)
+
+    def sha256(self, alias: str, path: str, **kwargs) -> str:
+        """
+        Get SHA256 hash of file.
+
+        Args:
+            alias: Session alias for the connection.
+            path: Path to the file.
+            **kwargs: Additional command execution options.
+
+        Returns:
+            SHA256 hash string.
+        """
+        command = f"""(Get-FileHash -Path {Windows.quote(path)} -Algorithm SHA256).Hash"""
         return self.execute_command(alias, command, **kwargs)
 
+    def sha256_local(self, path: str) -> str:
+        """
+        Get SHA256 hash of a file on the machine running the tests.
+
+        Useful to compare a local reference file with the result of sha256
+        on the remote host. The file is read in 1 MiB chunks.
+
+        Args:
+            path: Path to the local file.
+
+        Returns:
+            Uppercase SHA256 hash string, in the same format as Get-FileHash.
+        """
+        digest = hashlib.sha256()
+        with open(path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest().upper()
+
     def attributes(self, alias: str, path: str, **kwargs) -> dict:
         """
         Get file or directory attributes.
@@ -117,27 +221,55 @@ class File(ComponentBase):
         Returns:
             Dictionary containing file/directory attributes including Name, FullName, Length,
             CreationTime, LastWriteTime, LastAccessTime, Attributes, and Extension.
+
+        Raises:
+            FileNotFoundError: If the path does not exist.
+            ValueError: If the path matches several items, use attributes_all.
         """
-        command = f"""Get-Item -Path '{path}' | Select-Object Name, FullName, Length, CreationTime, LastWriteTime, LastAccessTime, Attributes, Extension | ConvertTo-Json -Compress"""
-        output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        item = self._item(alias, path, **kwargs)
+        return {field: item[field] for field in ATTRIBUTE_FIELDS if field in item}
 
-    def contains(self, alias: str, path: str, pattern: str, **kwargs) -> bool:
+    def attributes_all(self, alias: str, path: str, **kwargs) -> list:
+        """
+        Get the attributes of every item matching a path.
+
+        Args:
+            alias: Session alias for the connection.
+            path: Path to query, wildcards allowed.
+            **kwargs: Additional command execution options.
+
+        Returns:
+            One dictionary per matching item with the same keys as attributes,
+            empty if nothing matches.
+        """
+        return [
+            {field: item[field] for field in ATTRIBUTE_FIELDS if field in item}
+            for item in self.stat(alias, path, **kwargs)
+        ]
+
+    def contains(self, alias: str, path: str, pattern: str, literal: bool = False, **kwargs) -> bool:
         """
         Check if file contains a pattern.
 
+        The search stops at the first matching line.
+
         Args:
             alias: Session alias for the connection.
             path: Path to the file.
-            pattern: Pattern to search for.
+            pattern: Regular expression to search for, matched case-insensitively.
+            literal: Match pattern as plain text instead of a regular expression,
+                which skips regex evaluation on every line (default: False).
             **kwargs: Additional command execution options.
 
         Returns:
             True if pattern is found in the file, False otherwise.
         """
-        command = f"""Select-String -Path '{path}' -Pattern '{pattern}' -Quiet"""
+        simple_match = " -SimpleMatch" if literal else ""
+        command = f"""Select-String -Path {Windows.quote(path)} -Pattern {Windows.quote(pattern)}{simple_match} -Quiet"""
         output = self.execute_command(alias, command, **kwargs)
-        return output.strip().lower() == "true"
+        # Select-String prints True on a match and False or nothing otherwise,
+        # as str or bytes depending on the connector
+        return output.lstrip()[:1] in ("T", b"T")
 
     def owner(self, alias: str, path: str, **kwargs) -> str:
         """
@@ -151,7 +283,7 @@ class File(ComponentBase):
         Returns:
             Owner name as a string.
         """
-        command = f"""(Get-Acl -Path '{path}').Owner"""
+        command = f"""(Get-Acl -Path {Windows.quote(path)}).Owner"""
         return self.execute_command(alias, command, **kwargs)
 
     def permissions(self, alias: str, path: str, **kwargs) -> dict:
@@ -169,7 +301,7 @@ class File(ComponentBase):
             IdentityReference, IsInherited, InheritanceFlags, and PropagationFlags.
         """
         command = f"""
-Get-Acl -Path '{path}' | Select-Object Owner, Group, AccessToString, @{{
+Get-Acl -Path {Windows.quote(path)} | Select-Object Owner, Group, AccessToString, @{{
     Name='Access';
     Expression={{
         $_.Access | Select-Object FileSystemRights, AccessControlType, IdentityReference, IsInherited, InheritanceFlags, PropagationFlags
@@ -177,21 +309,89 @@ Get-Acl -Path '{path}' | Select-Object Owner, Group, AccessToString, @{{
 }} | ConvertTo-Json -Compress -Depth 3
 """.strip()
         output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        return json_loads(output)
+
+    # Access rule properties returned by permissions_table(), one column each
+    _ACCESS_COLUMNS = {
+        "Rights": "FileSystemRights",
+        "Types": "AccessControlType",
+        "Identities": "IdentityReference",
+        "Inherited": "IsInherited",
+        "InheritanceFlags": "InheritanceFlags",
+        "PropagationFlags": "PropagationFlags",
+    }
+
+    def permissions_table(self, alias: str, path: str, recurse: bool = False, **kwargs) -> list:
+        """
+        Get permissions of a path, and optionally of everything below it, in one call.
+
+        Access rules are returned column-wise: each column lists one property of
+        every rule, in the same order, so rule names are not repeated per entry
+        and large ACLs serialize much smaller than with permissions().
+
+        Args:
+            alias: Session alias for the connection.
+            path: Path to query.
+            recurse: Also include every file and directory below path.
+            **kwargs: Additional command execution options.
 
-    def list_directory(self, alias: str, path: str, **kwargs) -> list:
+        Returns:
+            List of dictionaries, one per item, containing Path, Owner, Group and
+            the Rights, Types, Identities, Inherited, InheritanceFlags and
+            PropagationFlags columns as lists of strings.
+        """
+        items = f"Get-Item -Path {Windows.quote(path)} -Force"
+        if recurse:
+            items = f"@({items}) + @(Get-ChildItem -Path {Windows.quote(path)} -Recurse -Force)"
+        columns = "; ".join(
+            f"{column} = @($rules | ForEach-Object {{ $_.{field}.ToString() }})"
+            for column, field in self._ACCESS_COLUMNS.items()
+        )
+        command = (
+            f"ConvertTo-Json -Compress -Depth 3 -InputObject @({items} | ForEach-Object {{ "
+            "$acl = Get-Acl -LiteralPath $_.FullName; $rules = $acl.Access; "
+            f"[ordered]@{{ Path = $_.FullName; Owner = $acl.Owner; Group = $acl.Group; {columns} }} }})"
+        )
+        return self._json_list(self.execute_command(alias, command, **kwargs))
+
+    def list_directory(self, alias: str, path: str, as_csv: bool = False, **kwargs) -> list:
         """
         List contents of a directory.
 
         Args:
             alias: Session alias for the connection.
             path: Path to the directory.
+            as_csv: Transfer the listing as CSV, lighter to produce and decode
+                than JSON, but every value is returned as a string (default: False).
             **kwargs: Additional command execution options.
 
         Returns:
             List of dictionaries containing Name, Length, LastWriteTime, and Attributes
             for each item in the directory. Returns empty list for empty directories.
         """
-        command = f"""@(Get-ChildItem -Path '{path}' | Select-Object Name, Length, LastWriteTime, Attributes) | ConvertTo-Json -AsArray -Compress"""
-        output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        if as_csv:
+            command = f"""Get-ChildItem -Path {Windows.quote(path)} | Select-Object Name, Length, LastWriteTime, Attributes | ConvertTo-Csv -NoTypeInformation"""
+            return self._csv_list(self.execute_command(alias, command, **kwargs))
+        command = f"""ConvertTo-Json -Compress -InputObject @(Get-ChildItem -Path {Windows.quote(path)} | Select-Object Name, Length, LastWriteTime, Attributes)"""
+        return self._json_list(self.execute_command(alias, command, **kwargs))
+
+    def iter_directory(self, alias: str, path: str, **kwargs):
+        """
+        Iterate over the contents of a directory, one item at a time.
+
+        PowerShell serializes each item on its own line, so large directories
+        are decoded incrementally and the caller can stop early.
+
+        Args:
+            alias: Session alias for the connection.
+            path: Path to the directory.
+            **kwargs: Additional command execution options.
+
+        Yields:
+            Dictionaries containing Name, Length, LastWriteTime, and Attributes.
+        """
+        command = (
+            f"Get-ChildItem -Path {Windows.quote(path)} | Select-Object Name, Length, LastWriteTime, Attributes "
+            "| ForEach-Object { $_ | ConvertTo-Json -Compress }"
+        )
+        yield from self._iter_json_lines(self.execute_command(alias, command, **kwargs))
@@ -4,27 +4,100 @@ Windows Firewall Module
 This module provides methods for managing and querying Windows Firewall settings,
 including profiles, rules, and security configurations using PowerShell cmdlets.
 """
-from sysbot.utils.engine import ComponentBase
-import json
+from sysbot.utils.engine import ComponentBase, json_loads, ttl_cache
+from sysbot.utils.helper import Windows
 from typing import Dict, List
 
+# Names accepted by Get-NetFirewallProfile -Name
+VALID_PROFILES = frozenset(("Domain", "Private", "Public"))
+
+# Profiles and filters returned with cache=True are at most this old
+STATE_TTL = 5
+
+# Properties returned for each rule by the rule listing methods
+RULE_FIELDS = "Name, DisplayName, Enabled, Direction, Action, Profile"
+
 
 class Firewall(ComponentBase):
     """Windows Firewall management class using PowerShell NetFirewall cmdlets."""
 
+    # PowerShell expressions fetched by bulk(), results are forced to arrays
+    _BULK_MAP = {
+        "profiles": "@(Get-NetFirewallProfile | Select-Object Name, Enabled, DefaultInboundAction, DefaultOutboundAction)",
+        "rules": f"@(Get-NetFirewallRule | Select-Object {RULE_FIELDS})",
+        "port_filters": "@(Get-NetFirewallPortFilter | Select-Object Protocol, LocalPort, RemotePort)",
+        "address_filters": "@(Get-NetFirewallAddressFilter | Select-Object LocalAddress, RemoteAddress)",
+    }
+
     @staticmethod
     def _validate_profile_name(profile: str) -> str:
-        valid_profiles = ["Domain", "Private", "Public"]
-        if profile not in valid_profiles:
+        if profile not in VALID_PROFILES:
             raise ValueError(
-                f"Invalid profile name: {profile}. Must be one of {valid_profiles}"
+                f"Invalid profile name: {profile}. Must be one of {sorted(VALID_PROFILES)}"
             )
         return profile
 
+    def _rules(self, alias: str, arguments: str, select: List[str] = None, **kwargs) -> List[Dict]:
+        """
+        Get the firewall rules selected by Get-NetFirewallRule arguments.
+
+        Args:
+            alias: Session alias for the connection.
+            arguments: Filtering arguments of Get-NetFirewallRule.
+            select: Properties to return instead of RULE_FIELDS.
+            **kwargs: Additional command execution options.
+
+        Returns:
+            List of dictionaries containing the selected properties of each rule.
+        """
+        projection = Windows.select(select) if select else f" | Select-Object {RULE_FIELDS}"
+        command = f"Get-NetFirewallRule {arguments}{projection} | ConvertTo-Json -Compress"
+        output = self.execute_command(alias, command, **kwargs)
+        return json_loads(output)
+
+    def bulk(self, alias: str, keys: List[str], **kwargs) -> Dict:
+        """
+        Get several firewall views in a single PowerShell round-trip.
+
+        Args:
+            alias: Session alias for the connection.
+            keys: Names of the results to fetch, among profiles, rules,
+                port_filters and address_filters.
+            **kwargs: Additional command execution options.
+
+        Returns:
+            Dictionary mapping each requested key to its list of objects, with
+            the same fields as the matching get* method.
+
+        Raises:
+            ValueError: If a key is not supported.
+        """
+        # One extra nesting level for the wrapping hashtable
+        command = Windows.bulk_command(self._BULK_MAP, keys, depth=3)
+        if not keys:
+            return {}
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
+
+    def snapshot(self, alias: str, **kwargs) -> Dict:
+        """
+        Get profiles, rules, port filters and address filters in one call.
+
+        Args:
+            alias: Session alias for the connection.
+            **kwargs: Additional command execution options.
+
+        Returns:
+            Dictionary with profiles, rules, port_filters and address_filters keys.
+        """
+        return self.bulk(alias, list(self._BULK_MAP), **kwargs)
+
+    @ttl_cache(STATE_TTL, opt_in=True)
     def getProfiles(self, alias: str, **kwargs) -> List[Dict]:
         """
         Get all firewall profiles.
 
+        Pass cache=True to accept a result up to 5 seconds old, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
             **kwargs: Additional command execution options.
@@ -33,14 +106,17 @@ class Firewall(ComponentBase):
             List of dictionaries containing profile information including Name, Enabled,
             DefaultInboundAction, and DefaultOutboundAction.
         """
-        command = "Get-NetFirewallProfile | Select-Object Name, Enabled, DefaultInboundAction, DefaultOutboundAction | ConvertTo-Json"
+        command = "Get-NetFirewallProfile | Select-Object Name, Enabled, DefaultInboundAction, DefaultOutboundAction | ConvertTo-Json -Compress"
         output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        return json_loads(output)
 
+    @ttl_cache(STATE_TTL, opt_in=True)
     def getProfile(self, alias: str, profile: str, **kwargs) -> Dict:
         """
         Get a specific firewall profile by name.
 
+        Pass cache=True to accept a result up to 5 seconds old, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
             profile: Profile name (Domain, Private, or Public).
@@ -51,25 +127,59 @@ class Firewall(ComponentBase):
             DefaultOutboundAction, LogAllowed, LogBlocked, LogFileName, and LogMaxSizeKilobytes.
         """
         validated_profile = self._validate_profile_name(profile)
-        command = f"Get-NetFirewallProfile -Name {validated_profile} | Select-Object Name, Enabled, DefaultInboundAction, DefaultOutboundAction, LogAllowed, LogBlocked, LogFileName, LogMaxSizeKilobytes | ConvertTo-Json"
+        command = f"Get-NetFirewallProfile -Name {validated_profile} | Select-Object Name, Enabled, DefaultInboundAction, DefaultOutboundAction, LogAllowed, LogBlocked, LogFileName, LogMaxSizeKilobytes | ConvertTo-Json -Compress"
         output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        return json_loads(output)
 
-    def getRules(self, alias: str, **kwargs) -> List[Dict]:
+    def getRules(
+        self, alias: str, compressed: bool = False, as_csv: bool = False, **kwargs
+    ) -> List[Dict]:
         """
         Get all firewall rules.
 
         Args:
             alias: Session alias for the connection.
+            compressed: Gzip the output on the remote host before transfer, worth
+                it on hosts with thousands of rules (default: False).
+            as_csv: Transfer the rules as CSV, lighter to produce and decode than
+                JSON, but every value is returned as a string (default: False).
             **kwargs: Additional command execution options.
 
         Returns:
             List of dictionaries containing rule information including Name, DisplayName,
             Enabled, Direction, Action, and Profile.
         """
-        command = "Get-NetFirewallRule | Select-Object Name, DisplayName, Enabled, Direction, Action, Profile | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        command = f"Get-NetFirewallRule | Select-Object {RULE_FIELDS}"
+        command += " | ConvertTo-Csv -NoTypeInformation" if as_csv else " | ConvertTo-Json -Compress"
+        if compressed:
+            output = Windows.gunzip_output(
+                self.execute_command(alias, Windows.gzip_command(command), **kwargs)
+            )
+        else:
+            output = self.execute_command(alias, command, **kwargs)
+        return self._csv_list(output) if as_csv else json_loads(output)
+
+    def iter_rules(self, alias: str, **kwargs):
+        """
+        Iterate over all firewall rules, one rule at a time.
+
+        PowerShell serializes each rule on its own line, so hosts with
+        thousands of rules are decoded incrementally and the caller can stop
+        early.
+
+        Args:
+            alias: Session alias for the connection.
+            **kwargs: Additional command execution options.
+
+        Yields:
+            Dictionaries containing rule information including Name, DisplayName,
+            Enabled, Direction, Action, and Profile.
+        """
+        command = (
+            f"Get-NetFirewallRule | Select-Object {RULE_FIELDS} "
+            "| ForEach-Object { $_ | ConvertTo-Json -Compress }"
+        )
+        yield from self._iter_json_lines(self.execute_command(alias, command, **kwargs))
 
     def getRule(self, alias: str, name: str, **kwargs) -> Dict:
         """
@@ -84,12 +194,12 @@ class Firewall(ComponentBase):
             Dictionary containing rule details including Name, DisplayName, Enabled,
             Direction, Action, Profile, and Description.
         """
-        command = f"Get-NetFirewallRule -Name '{name}' | Select-Object Name, DisplayName, Enabled, Direction, Action, Profile, Description | ConvertTo-Json"
+        command = f"Get-NetFirewallRule -Name {Windows.quote(name)} | Select-Object {RULE_FIELDS}, Description | ConvertTo-Json -Compress"
         output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        return json_loads(output)
 
     def getRulesByDisplayName(
-        self, alias: str, display_name: str, **kwargs
+        self, alias: str, display_name: str, select: List[str] = None, **kwargs
     ) -> List[Dict]:
         """
         Get firewall rules by display name.
@@ -97,64 +207,67 @@ class Firewall(ComponentBase):
         Args:
             alias: Session alias for the connection.
             display_name: Display name to search for.
+            select: Properties to return (default: None for Name, DisplayName,
+                Enabled, Direction, Action, and Profile).
             **kwargs: Additional command execution options.
 
         Returns:
             List of dictionaries containing matching rule information.
         """
-        command = f"Get-NetFirewallRule -DisplayName '{display_name}' | Select-Object Name, DisplayName, Enabled, Direction, Action, Profile | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        return self._rules(alias, f"-DisplayName {Windows.quote(display_name)}", select, **kwargs)
 
-    def getEnabledRules(self, alias: str, **kwargs) -> List[Dict]:
+    def getEnabledRules(self, alias: str, select: List[str] = None, **kwargs) -> List[Dict]:
         """
         Get all enabled firewall rules.
 
         Args:
             alias: Session alias for the connection.
+            select: Properties to return (default: None for Name, DisplayName,
+                Enabled, Direction, Action, and Profile).
             **kwargs: Additional command execution options.
 
         Returns:
             List of dictionaries containing enabled rule information.
         """
-        command = "Get-NetFirewallRule -Enabled True | Select-Object Name, DisplayName, Enabled, Direction, Action, Profile | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        return self._rules(alias, "-Enabled True", select, **kwargs)
 
-    def getInboundRules(self, alias: str, **kwargs) -> List[Dict]:
+    def getInboundRules(self, alias: str, select: List[str] = None, **kwargs) -> List[Dict]:
         """
         Get all inbound firewall rules.
 
         Args:
             alias: Session alias for the connection.
+            select: Properties to return (default: None for Name, DisplayName,
+                Enabled, Direction, Action, and Profile).
             **kwargs: Additional command execution options.
 
         Returns:
             List of dictionaries containing inbound rule information.
         """
-        command = "Get-NetFirewallRule -Direction Inbound | Select-Object Name, DisplayName, Enabled, Direction, Action, Profile | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        return self._rules(alias, "-Direction Inbound", select, **kwargs)
 
-    def getOutboundRules(self, alias: str, **kwargs) -> List[Dict]:
+    def getOutboundRules(self, alias: str, select: List[str] = None, **kwargs) -> List[Dict]:
         """
         Get all outbound firewall rules.
 
         Args:
             alias: Session alias for the connection.
+            select: Properties to return (default: None for Name, DisplayName,
+                Enabled, Direction, Action, and Profile).
             **kwargs: Additional command execution options.
 
         Returns:
             List of dictionaries containing outbound rule information.
         """
-        command = "Get-NetFirewallRule -Direction Outbound | Select-Object Name, DisplayName, Enabled, Direction, Action, Profile | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        return self._rules(alias, "-Direction Outbound", select, **kwargs)
 
+    @ttl_cache(STATE_TTL, opt_in=True)
     def getPortFilters(self, alias: str, **kwargs) -> List[Dict]:
         """
         Get port filters for firewall rules.
 
+        Pass cache=True to accept a result up to 5 seconds old, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
             **kwargs: Additional command execution options.
@@ -163,14 +276,17 @@ class Firewall(ComponentBase):
             List of dictionaries containing port filter information including Protocol,
             LocalPort, and RemotePort.
         """
-        command = "Get-NetFirewallPortFilter | Select-Object Protocol, LocalPort, RemotePort | ConvertTo-Json"
+        command = "Get-NetFirewallPortFilter | Select-Object Protocol, LocalPort, RemotePort | ConvertTo-Json -Compress"
         output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        return json_loads(output)
 
+    @ttl_cache(STATE_TTL, opt_in=True)
     def getAddressFilters(self, alias: str, **kwargs) -> List[Dict]:
         """
         Get address filters for firewall rules.
 
+        Pass cache=True to accept a result up to 5 seconds old, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
             **kwargs: Additional command execution options.
@@ -179,6 +295,6 @@ class Firewall(ComponentBase):
             List of dictionaries containing address filter information including
             LocalAddress and RemoteAddress.
         """
-        command = "Get-NetFirewallAddressFilter | Select-Object LocalAddress, RemoteAddress | ConvertTo-Json"
+        command = "Get-NetFirewallAddressFilter | Select-Object LocalAddress, RemoteAddress | ConvertTo-Json -Compress"
         output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        return json_loads(output)
@@ -5,14 +5,44 @@ This module provides methods for managing and querying network interfaces,
 IP addresses, routes, and network configuration on Windows systems using
 CIM/WMI classes.
 """
-from sysbot.utils.engine import ComponentBase
+import ipaddress
+
+from sysbot.utils.engine import ComponentBase, json_loads
 from sysbot.utils.helper import Windows
-import json
 
 
 class Ip(ComponentBase):
     """Windows network interface management class using CIM/WMI."""
 
+    # PowerShell expressions fetched by bulk(), results are forced to arrays
+    _BULK_MAP = {
+        "addr": "@(Get-CimInstance -Namespace root\\cimv2 -ClassName Win32_NetworkAdapterConfiguration | Select-Object DHCPEnabled, IPAddress, IPSubnet, DefaultIPGateway, DNSServerSearchOrder, ServiceName, Index, MTU)",
+        "link": "@(Get-CimInstance -Namespace root/StandardCimv2 -ClassName MSFT_NetAdapter | Select-Object Name, Status, LinkSpeed, PhysicalMediaType, MacAddress)",
+        "route": "@(Get-CimInstance -Namespace root/StandardCimv2 -ClassName MSFT_NetRoute | Select-Object InterfaceAlias, NextHop, State, DestinationPrefix)",
+    }
+
+    def bulk(self, alias: str, keys: list, **kwargs) -> dict:
+        """
+        Get several network views in a single PowerShell round-trip.
+
+        Args:
+            alias: Session alias for the connection.
+            keys: Names of the results to fetch, among addr, link and route.
+            **kwargs: Additional command execution options.
+
+        Returns:
+            Dictionary mapping each requested key to its list of objects, with
+            the same fields as the matching method.
+
+        Raises:
+            ValueError: If a key is not supported.
+        """
+        # Default depth of the individual methods, plus the wrapping hashtable
+        command = Windows.bulk_command(self._BULK_MAP, keys, depth=3)
+        if not keys:
+            return {}
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
+
     def addr(self, alias: str, **kwargs) -> dict:
         """
         Get network adapter IP configuration.
@@ -31,7 +61,7 @@ class Ip(ComponentBase):
             property="DHCPEnabled, IPAddress, IPSubnet, DefaultIPGateway, DNSServerSearchOrder, ServiceName, Index, MTU",
         )
         output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        return json_loads(output)
 
     def link(self, alias: str, **kwargs) -> dict:
         """
@@ -51,7 +81,7 @@ class Ip(ComponentBase):
             property="Name, Status, LinkSpeed, PhysicalMediaType, MacAddress",
         )
         output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        return json_loads(output)
 
     def route(self, alias: str, **kwargs) -> dict:
         """
@@ -71,7 +101,36 @@ class Ip(ComponentBase):
             property="InterfaceAlias, NextHop, State, DestinationPrefix",
         )
         output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        return json_loads(output)
+
+    def route_lookup(self, alias: str, address: str, **kwargs) -> list:
+        """
+        Get the routes matching a destination address, most specific first.
+
+        Args:
+            alias: Session alias for the connection.
+            address: Destination IPv4 or IPv6 address.
+            **kwargs: Additional command execution options.
+
+        Returns:
+            List of route dictionaries whose DestinationPrefix contains address,
+            ordered by decreasing prefix length, so the first entry is the route
+            the system uses.
+
+        Raises:
+            ValueError: If address is not a valid IP address.
+        """
+        target = ipaddress.ip_address(address)
+        routes = self.route(alias, **kwargs)
+        if isinstance(routes, dict):
+            routes = [routes]
+        matches = []
+        for route in routes:
+            network = ipaddress.ip_network(route["DestinationPrefix"], strict=False)
+            if network.version == target.version and target in network:
+                matches.append((network.prefixlen, route))
+        matches.sort(key=lambda match: match[0], reverse=True)
+        return [route for _, route in matches]
 
     def resolve(self, alias: str, fqdn: str, **kwargs) -> dict:
         """
@@ -85,11 +144,11 @@ class Ip(ComponentBase):
         Returns:
             JSON-parsed result containing the resolved IP address(es) as a list or single value.
         """
-        command = f"(Resolve-DnsName {fqdn}).IPAddress | ConvertTo-Json"
+        command = f"(Resolve-DnsName -Name {Windows.quote(fqdn)}).IPAddress | ConvertTo-Json -Compress"
         output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        return json_loads(output)
 
-    def ping(self, alias: str, host: str, **kwargs) -> dict:
+    def ping(self, alias: str, host: str, **kwargs) -> bool:
         """
         Test network connectivity to a host using Test-Connection.
 
@@ -99,7 +158,10 @@ class Ip(ComponentBase):
             **kwargs: Additional command execution options.
 
         Returns:
-            String result from PowerShell ('True' or 'False') indicating connectivity status.
+            True if the host answered, False otherwise.
         """
-        command = f"Test-Connection -ComputerName {host} -Count 1 -Quiet"
-        return self.execute_command(alias, command, **kwargs)
+        command = f"Test-Connection -ComputerName {Windows.quote(host)} -Count 1 -BufferSize 32 -Quiet"
+        output = self.execute_command(alias, command, **kwargs)
+        # Test-Connection -Quiet prints True or False, as str or bytes depending
+        # on the connector
+        return output.lstrip()[:1] in ("T", b"T")
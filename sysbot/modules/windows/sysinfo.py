@@ -5,13 +5,89 @@ This module provides methods for retrieving system information on Windows system
 including hostname, domain, timezone, hardware details, and operating system
 information using PowerShell and WMI.
 """
-from sysbot.utils.engine import ComponentBase
-import json
+from sysbot.utils.engine import ComponentBase, json_loads, ttl_cache
+from sysbot.utils.helper import Windows
+
+# Hardware and OS descriptions are static during a test run, cache them for a minute
+HARDWARE_TTL = 60
+
+# Win32_OperatingSystem properties, CIM returns InstallDate as a DateTime so it
+# is converted back to the DMTF string Get-WmiObject used to return
+OS_FIELDS = (
+    "Caption, @{Name='InstallDate'; Expression={[Management.ManagementDateTimeConverter]::ToDmtfDateTime($_.InstallDate)}}, "
+    "Version, BootDevice, BuildNumber, MUILanguages, SystemDirectory, SystemDrive, WindowsDirectory"
+)
 
 
 class Sysinfo(ComponentBase):
     """Windows system information retrieval class using PowerShell and WMI."""
 
+    # PowerShell expressions fetched by bulk(), list results are forced to arrays
+    _BULK_MAP = {
+        "hostname": "$env:computername",
+        "fqdn": "[System.Net.Dns]::GetHostByName($env:computerName).HostName",
+        "domain": "$env:USERDNSDOMAIN",
+        "timezone": "(Get-Date).ToUniversalTime().ToString('zzz')",
+        "software": "@((Get-ItemProperty HKLM:\\Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\* | Where-Object {$_.DisplayName -ne $null}).DisplayName)",
+        "process": "@(Get-CimInstance -ClassName Win32_Process | Select-Object ProcessName, PageFileUsage, PeakVirtualSize, PrivatePageCount)",
+        "operatingsystem": f"(Get-CimInstance -ClassName Win32_OperatingSystem | Select-Object {OS_FIELDS})",
+        "physicalmemory": "@(Get-CimInstance -ClassName Win32_PhysicalMemory | Select-Object Capacity)",
+        "processor": "@(Get-CimInstance -ClassName Win32_Processor | Select-Object Caption, DeviceID, MaxClockSpeed, NumberOfCores, NumberOfLogicalProcessors)",
+        "diskdrive": "@(Get-CimInstance -ClassName Win32_DiskDrive | Select-Object Name, Caption, Partitions, BytesPerSector, Size, SerialNumber)",
+        "logicaldisk": "@(Get-CimInstance -ClassName Win32_LogicalDisk | Select-Object Caption, FileSystem, Size)",
+        "service": "@(Get-CimInstance -ClassName Win32_Service | Select-Object Name, DisplayName, StartName, State, StartMode)",
+    }
+
+    def bulk(self, alias: str, keys: list, **kwargs) -> dict:
+        """
+        Get several system facts and WMI inventories in a single PowerShell round-trip.
+
+        Args:
+            alias: Session alias for the connection.
+            keys: Names of the results to fetch, among hostname, fqdn, domain,
+                timezone, software, process, operatingsystem, physicalmemory,
+                processor, diskdrive, logicaldisk and service.
+            **kwargs: Additional command execution options.
+
+        Returns:
+            Dictionary mapping each requested key to its result: strings for
+            hostname, fqdn, domain and timezone, a list of display names for
+            software, a dictionary for operatingsystem and lists for the other
+            win32_* inventories, with the same fields as the matching method.
+
+        Raises:
+            ValueError: If a key is not supported.
+        """
+        # Default depth of the individual methods, plus the wrapping hashtable
+        command = Windows.bulk_command(self._BULK_MAP, keys, depth=3)
+        if not keys:
+            return {}
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
+
+    @staticmethod
+    def _wql_filter(**conditions) -> str:
+        """
+        Build a -Filter argument matching CIM properties by equality.
+
+        Filtering in the WMI provider means only matching instances are
+        serialized and transferred.
+
+        Args:
+            **conditions: Property names mapped to the expected value, None
+                values are ignored.
+
+        Returns:
+            The -Filter parameter string, empty when no condition is set.
+        """
+        clauses = []
+        for name, value in conditions.items():
+            if value is not None:
+                wql_value = str(value).replace("\\", "\\\\").replace("'", "\\'")
+                clauses.append(f"{name} = '{wql_value}'")
+        if not clauses:
+            return ""
+        return " -Filter " + Windows.quote(" AND ".join(clauses))
+
     def hostname(self, alias: str, **kwargs) -> str:
         """
         Get the system hostname (short name).
@@ -100,29 +176,55 @@ class Sysinfo(ComponentBase):
             Value of the environment variable.
         """
         return self.execute_command(
-            alias, f"[Environment]::GetEnvironmentVariable('{name}')", **kwargs
+            alias, f"[Environment]::GetEnvironmentVariable({Windows.quote(name)})", **kwargs
         )
 
-    def win32_process(self, alias: str, **kwargs) -> dict:
+    def win32_process(self, alias: str, name: str = None, **kwargs) -> dict:
         """
         Get process information using WMI Win32_Process class.
 
         Args:
             alias: Session alias for the connection.
+            name: Only return processes with this executable name, e.g. "lsass.exe"
+                (default: None for all processes).
             **kwargs: Additional command execution options.
 
         Returns:
             Dictionary containing process information including ProcessName, PageFileUsage,
             PeakVirtualSize, and PrivatePageCount.
         """
-        command = "Get-WmiObject -Class Win32_Process | Select-Object ProcessName, PageFileUsage, PeakVirtualSize, PrivatePageCount | ConvertTo-Json"
+        command = f"Get-CimInstance -ClassName Win32_Process{self._wql_filter(Name=name)} | Select-Object ProcessName, PageFileUsage, PeakVirtualSize, PrivatePageCount | ConvertTo-Json -Compress"
         output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        return json_loads(output)
+
+    def iter_win32_process(self, alias: str, **kwargs):
+        """
+        Iterate over processes using WMI Win32_Process class, one process at a time.
 
+        PowerShell serializes each process on its own line, so the list is
+        decoded incrementally and the caller can stop early.
+
+        Args:
+            alias: Session alias for the connection.
+            **kwargs: Additional command execution options.
+
+        Yields:
+            Dictionaries containing ProcessName, PageFileUsage, PeakVirtualSize,
+            and PrivatePageCount.
+        """
+        command = (
+            "Get-CimInstance -ClassName Win32_Process | Select-Object ProcessName, PageFileUsage, PeakVirtualSize, PrivatePageCount "
+            "| ForEach-Object { $_ | ConvertTo-Json -Compress }"
+        )
+        yield from self._iter_json_lines(self.execute_command(alias, command, **kwargs))
+
+    @ttl_cache(HARDWARE_TTL)
     def win32_operatingsystem(self, alias: str, **kwargs) -> dict:
         """
         Get operating system information using WMI Win32_OperatingSystem class.
 
+        Cached for 60 seconds, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
             **kwargs: Additional command execution options.
@@ -131,14 +233,17 @@ class Sysinfo(ComponentBase):
             Dictionary containing OS information including Caption, InstallDate, Version,
             BootDevice, BuildNumber, MUILanguages, SystemDirectory, SystemDrive, and WindowsDirectory.
         """
-        command = "Get-WmiObject -Class Win32_OperatingSystem | Select-Object Caption, InstallDate, Version, BootDevice, BuildNumber, MUILanguages, SystemDirectory, SystemDrive, WindowsDirectory | ConvertTo-Json"
+        command = f"Get-CimInstance -ClassName Win32_OperatingSystem | Select-Object {OS_FIELDS} | ConvertTo-Json -Compress"
         output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        return json_loads(output)
 
+    @ttl_cache(HARDWARE_TTL)
     def win32_physicalmemory(self, alias: str, **kwargs) -> dict:
         """
         Get physical memory information using WMI Win32_PhysicalMemory class.
 
+        Cached for 60 seconds, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
             **kwargs: Additional command execution options.
@@ -146,14 +251,17 @@ class Sysinfo(ComponentBase):
         Returns:
             Dictionary containing physical memory Capacity information.
         """
-        command = "Get-WmiObject -Class Win32_PhysicalMemory | Select-Object Capacity | ConvertTo-Json"
+        command = "Get-CimInstance -ClassName Win32_PhysicalMemory | Select-Object Capacity | ConvertTo-Json -Compress"
         output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        return json_loads(output)
 
+    @ttl_cache(HARDWARE_TTL)
     def win32_processor(self, alias: str, **kwargs) -> dict:
         """
         Get processor information using WMI Win32_Processor class.
 
+        Cached for 60 seconds, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
             **kwargs: Additional command execution options.
@@ -162,9 +270,9 @@ class Sysinfo(ComponentBase):
             Dictionary containing CPU information including Caption, DeviceID, MaxClockSpeed,
             NumberOfCores, and NumberOfLogicalProcessors.
         """
-        command = "Get-WmiObject -class Win32_Processor | Select-Object Caption, DeviceID, MaxClockSpeed, NumberOfCores, NumberOfLogicalProcessors | ConvertTo-Json"
+        command = "Get-CimInstance -ClassName Win32_Processor | Select-Object Caption, DeviceID, MaxClockSpeed, NumberOfCores, NumberOfLogicalProcessors | ConvertTo-Json -Compress"
         output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        return json_loads(output)
 
     def win32_diskdrive(self, alias: str, **kwargs) -> dict:
         """
@@ -178,9 +286,9 @@ class Sysinfo(ComponentBase):
             Dictionary containing disk drive information including Name, Caption, Partitions,
             BytesPerSector, Size, and SerialNumber.
         """
-        command = "Get-WmiObject -Class Win32_DiskDrive | Select-Object Name, Caption, Partitions, BytesPerSector, Size, SerialNumber | ConvertTo-Json"
+        command = "Get-CimInstance -ClassName Win32_DiskDrive | Select-Object Name, Caption, Partitions, BytesPerSector, Size, SerialNumber | ConvertTo-Json -Compress"
         output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        return json_loads(output)
 
     def win32_logicaldisk(self, alias: str, **kwargs) -> dict:
         """
@@ -193,25 +301,48 @@ class Sysinfo(ComponentBase):
         Returns:
             Dictionary containing logical disk information including Caption, FileSystem, and Size.
         """
-        command = "Get-WmiObject -Class Win32_LogicalDisk | Select-Object Caption, FileSystem, Size | ConvertTo-Json"
+        command = "Get-CimInstance -ClassName Win32_LogicalDisk | Select-Object Caption, FileSystem, Size | ConvertTo-Json -Compress"
         output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        return json_loads(output)
 
-    def win32_service(self, alias: str, **kwargs) -> dict:
+    def win32_service(self, alias: str, name: str = None, state: str = None, **kwargs) -> dict:
         """
         Get service information using WMI Win32_Service class.
 
         Args:
             alias: Session alias for the connection.
+            name: Only return the service with this name (default: None for all).
+            state: Only return services in this state, e.g. "Running" or "Stopped"
+                (default: None for all).
             **kwargs: Additional command execution options.
 
         Returns:
             Dictionary containing service information including Name, DisplayName, StartName,
             State, and StartMode.
         """
-        command = "Get-WmiObject -Class Win32_Service | Select-Object Name, DisplayName, StartName, State, StartMode | ConvertTo-Json"
+        command = f"Get-CimInstance -ClassName Win32_Service{self._wql_filter(Name=name, State=state)} | Select-Object Name, DisplayName, StartName, State, StartMode | ConvertTo-Json -Compress"
         output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        return json_loads(output)
+
+    def iter_win32_service(self, alias: str, **kwargs):
+        """
+        Iterate over services using WMI Win32_Service class, one service at a time.
+
+        PowerShell serializes each service on its own line, so the list is
+        decoded incrementally and the caller can stop early.
+
+        Args:
+            alias: Session alias for the connection.
+            **kwargs: Additional command execution options.
+
+        Yields:
+            Dictionaries containing Name, DisplayName, StartName, State, and StartMode.
+        """
+        command = (
+            "Get-CimInstance -ClassName Win32_Service | Select-Object Name, DisplayName, StartName, State, StartMode "
+            "| ForEach-Object { $_ | ConvertTo-Json -Compress }"
+        )
+        yield from self._iter_json_lines(self.execute_command(alias, command, **kwargs))
 
     def roles(self, alias: str, **kwargs) -> dict:
         """
@@ -225,24 +356,30 @@ class Sysinfo(ComponentBase):
             Dictionary containing installed roles and features information.
         """
         output = self.execute_command(
-            alias, "Get-WindowsFeature | ConvertTo-Json", **kwargs
+            alias, "Get-WindowsFeature | ConvertTo-Json -Compress", **kwargs
         )
-        return json.loads(output)
+        return json_loads(output)
 
-    def software(self, alias: str, **kwargs) -> list:
+    def software(self, alias: str, pattern: str = None, **kwargs) -> list:
         """
         Get list of installed software from the registry.
 
         Args:
             alias: Session alias for the connection.
+            pattern: Only return display names matching this wildcard pattern,
+                e.g. "Microsoft Visual C++*" (default: None for all).
             **kwargs: Additional command execution options.
 
         Returns:
             List of installed software display names.
         """
+        if pattern is None:
+            where = "$_.DisplayName -ne $null"
+        else:
+            where = f"$_.DisplayName -like {Windows.quote(pattern)}"
         output = self.execute_command(
             alias,
-            "(Get-ItemProperty HKLM:\\Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\* | Where-Object {$_.DisplayName -ne $null}).DisplayName",
+            f"(Get-ItemProperty HKLM:\\Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\* | Where-Object {{{where}}}).DisplayName",
             **kwargs,
         )
         return output.splitlines()
@@ -261,7 +398,7 @@ class Sysinfo(ComponentBase):
         """
         output = self.execute_command(
             alias,
-            f"Get-Item -Path Registry::{path} | Select-Object -ExpandProperty Property",
+            f"Get-Item -Path {Windows.quote('Registry::' + path)} | Select-Object -ExpandProperty Property",
             **kwargs,
         )
         return output.splitlines()
@@ -4,8 +4,7 @@ Windows User Management Module
 This module provides methods for managing and querying user and group information
 on Windows systems using WMI (Windows Management Instrumentation).
 """
-from sysbot.utils.engine import ComponentBase
-import json
+from sysbot.utils.engine import ComponentBase, json_loads
 
 
 class Users(ComponentBase):
@@ -23,9 +22,9 @@ class Users(ComponentBase):
             Dictionary containing user account details including FullName, LocalAccount,
             Domain, Lockout status, Name, PasswordChangeable, PasswordRequired, and SID.
         """
-        command = "Get-WmiObject -Class Win32_UserAccount | Select-Object FullName, LocalAccount, Domain, Lockout, Name, PasswordChangeable, PasswordRequired, SID | ConvertTo-Json"
+        command = "Get-CimInstance -ClassName Win32_UserAccount | Select-Object FullName, LocalAccount, Domain, Lockout, Name, PasswordChangeable, PasswordRequired, SID | ConvertTo-Json -Compress"
         output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        return json_loads(output)
 
     def win32_group(self, alias: str, **kwargs) -> dict:
         """
@@ -38,6 +37,6 @@ class Users(ComponentBase):
         Returns:
             Dictionary containing group details including Name, Domain, LocalAccount, and SID.
         """
-        command = "Get-WmiObject -Class Win32_Group | Select-Object Name, Domain, LocalAccount, SID | ConvertTo-Json"
+        command = "Get-CimInstance -ClassName Win32_Group | Select-Object Name, Domain, LocalAccount, SID | ConvertTo-Json -Compress"
         output = self.execute_command(alias, command, **kwargs)
-        return json.loads(output)
+        return json_loads(output)
@@ -5,17 +5,23 @@ This module provides methods for managing and querying Veeam Backup & Replicatio
 including backup jobs, repositories, managed servers, backup sessions, and restore
 operations using PowerShell Veeam cmdlets.
 """
-from sysbot.utils.engine import ComponentBase
-import json
+from sysbot.utils.engine import ComponentBase, ttl_cache
+from sysbot.utils.helper import Windows
+
+# Managed servers returned with cache=True are at most this old
+CONFIG_TTL = 60
 
 
 class Veeam(ComponentBase):
     """Veeam Backup & Replication management class using PowerShell Veeam cmdlets."""
 
+    @ttl_cache(CONFIG_TTL, opt_in=True)
     def get_servers(self, alias: str, **kwargs) -> list:
         """
         Get managed servers in Veeam Backup & Replication.
 
+        Pass cache=True to accept a result up to 60 seconds old, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
             **kwargs: Additional command execution options.
@@ -23,15 +29,8 @@ class Veeam(ComponentBase):
         Returns:
             List of dictionaries containing server information including Name, Description, Type, and Info.
         """
-        command = "Get-VBRServer | Select-Object Name, Description, Type, Info | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
+        command = "Get-VBRServer | Select-Object Name, Description, Type, Info | ConvertTo-Json -Compress"
+        return self._json_list(self.execute_command(alias, command, **kwargs))
 
     def get_backup_repositories(self, alias: str, name: str = None, **kwargs) -> list:
         """
@@ -47,17 +46,10 @@ class Veeam(ComponentBase):
             Name, Description, Path, Type, and Extent.
         """
         if name:
-            command = f"Get-VBRBackupRepository -Name '{name}' | Select-Object Name, Description, Path, Type, Extent | ConvertTo-Json"
+            command = f"Get-VBRBackupRepository -Name {Windows.quote(name)} | Select-Object Name, Description, Path, Type, Extent | ConvertTo-Json -Compress"
         else:
-            command = "Get-VBRBackupRepository | Select-Object Name, Description, Path, Type, Extent | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
+            command = "Get-VBRBackupRepository | Select-Object Name, Description, Path, Type, Extent | ConvertTo-Json -Compress"
+        return self._json_list(self.execute_command(alias, command, **kwargs))
 
     def get_jobs(self, alias: str, name: str = None, **kwargs) -> list:
         """
@@ -73,17 +65,10 @@ class Veeam(ComponentBase):
             JobType, IsScheduleEnabled, IsRunning, and LastResult.
         """
         if name:
-            command = f"Get-VBRJob -Name '{name}' | Select-Object Name, Description, JobType, IsScheduleEnabled, IsRunning, LastResult | ConvertTo-Json"
+            command = f"Get-VBRJob -Name {Windows.quote(name)} | Select-Object Name, Description, JobType, IsScheduleEnabled, IsRunning, LastResult | ConvertTo-Json -Compress"
         else:
-            command = "Get-VBRJob | Select-Object Name, Description, JobType, IsScheduleEnabled, IsRunning, LastResult | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
+            command = "Get-VBRJob | Select-Object Name, Description, JobType, IsScheduleEnabled, IsRunning, LastResult | ConvertTo-Json -Compress"
+        return self._json_list(self.execute_command(alias, command, **kwargs))
 
     def get_backups(self, alias: str, name: str = None, **kwargs) -> list:
         """
@@ -99,17 +84,10 @@ class Veeam(ComponentBase):
             JobName, CreationTime, and JobType.
         """
         if name:
-            command = f"Get-VBRBackup -Name '{name}' | Select-Object Name, Description, JobName, CreationTime, JobType | ConvertTo-Json"
+            command = f"Get-VBRBackup -Name {Windows.quote(name)} | Select-Object Name, Description, JobName, CreationTime, JobType | ConvertTo-Json -Compress"
         else:
-            command = "Get-VBRBackup | Select-Object Name, Description, JobName, CreationTime, JobType | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
+            command = "Get-VBRBackup | Select-Object Name, Description, JobName, CreationTime, JobType | ConvertTo-Json -Compress"
+        return self._json_list(self.execute_command(alias, command, **kwargs))
 
     def get_restore_points(self, alias: str, backup_name: str = None, **kwargs) -> list:
         """
@@ -125,17 +103,33 @@ class Veeam(ComponentBase):
             CreationTime, Type, and VmName.
         """
         if backup_name:
-            command = f"Get-VBRBackup -Name '{backup_name}' | Get-VBRRestorePoint | Select-Object Name, CreationTime, Type, VmName | ConvertTo-Json"
+            command = f"Get-VBRBackup -Name {Windows.quote(backup_name)} | Get-VBRRestorePoint | Select-Object Name, CreationTime, Type, VmName | ConvertTo-Json -Compress"
         else:
-            command = "Get-VBRBackup | Get-VBRRestorePoint | Select-Object Name, CreationTime, Type, VmName | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
+            command = "Get-VBRBackup | Get-VBRRestorePoint | Select-Object Name, CreationTime, Type, VmName | ConvertTo-Json -Compress"
+        return self._json_list(self.execute_command(alias, command, **kwargs))
+
+    def iter_restore_points(self, alias: str, backup_name: str = None, **kwargs):
+        """
+        Iterate over restore points, one restore point at a time.
+
+        PowerShell serializes each restore point on its own line, so large
+        backup catalogs are decoded incrementally and the caller can stop early.
+
+        Args:
+            alias: Session alias for the connection.
+            backup_name: Optional backup name to filter restore points by.
+            **kwargs: Additional command execution options.
+
+        Yields:
+            Dictionaries containing restore point information including Name,
+            CreationTime, Type, and VmName.
+        """
+        backup = f"Get-VBRBackup -Name {Windows.quote(backup_name)}" if backup_name else "Get-VBRBackup"
+        command = (
+            f"{backup} | Get-VBRRestorePoint | Select-Object Name, CreationTime, Type, VmName "
+            "| ForEach-Object { $_ | ConvertTo-Json -Compress }"
+        )
+        yield from self._iter_json_lines(self.execute_command(alias, command, **kwargs))
 
     def get_backup_sessions(self, alias: str, job_name: str = None, **kwargs) -> list:
         """
@@ -151,17 +145,36 @@ class Veeam(ComponentBase):
             JobName, State, Result, CreationTime, and EndTime.
         """
         if job_name:
-            command = f"Get-VBRJob -Name '{job_name}' | Get-VBRBackupSession | Select-Object Name, JobName, State, Result, CreationTime, EndTime | ConvertTo-Json"
+            command = f"Get-VBRJob -Name {Windows.quote(job_name)} | Get-VBRBackupSession | Select-Object Name, JobName, State, Result, CreationTime, EndTime | ConvertTo-Json -Compress"
+        else:
+            command = "Get-VBRBackupSession | Select-Object Name, JobName, State, Result, CreationTime, EndTime | ConvertTo-Json -Compress"
+        return self._json_list(self.execute_command(alias, command, **kwargs))
+
+    def iter_backup_sessions(self, alias: str, job_name: str = None, **kwargs):
+        """
+        Iterate over backup sessions, one session at a time.
+
+        PowerShell serializes each session on its own line, so long session
+        histories are decoded incrementally and the caller can stop early.
+
+        Args:
+            alias: Session alias for the connection.
+            job_name: Optional job name to filter sessions by.
+            **kwargs: Additional command execution options.
+
+        Yields:
+            Dictionaries containing backup session information including Name,
+            JobName, State, Result, CreationTime, and EndTime.
+        """
+        if job_name:
+            sessions = f"Get-VBRJob -Name {Windows.quote(job_name)} | Get-VBRBackupSession"
         else:
-            command = "Get-VBRBackupSession | Select-Object Name, JobName, State, Result, CreationTime, EndTime | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
+            sessions = "Get-VBRBackupSession"
+        command = (
+            f"{sessions} | Select-Object Name, JobName, State, Result, CreationTime, EndTime "
+            "| ForEach-Object { $_ | ConvertTo-Json -Compress }"
+        )
+        yield from self._iter_json_lines(self.execute_command(alias, command, **kwargs))
 
     def get_vi_servers(self, alias: str, name: str = None, **kwargs) -> list:
         """
@@ -177,17 +190,10 @@ class Veeam(ComponentBase):
             Description, Type, ApiVersion, and IsUnavailable.
         """
         if name:
-            command = f"Get-VBRViServer -Name '{name}' | Select-Object Name, Description, Type, ApiVersion, IsUnavailable | ConvertTo-Json"
+            command = f"Get-VBRViServer -Name {Windows.quote(name)} | Select-Object Name, Description, Type, ApiVersion, IsUnavailable | ConvertTo-Json -Compress"
         else:
-            command = "Get-VBRViServer | Select-Object Name, Description, Type, ApiVersion, IsUnavailable | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
+            command = "Get-VBRViServer | Select-Object Name, Description, Type, ApiVersion, IsUnavailable | ConvertTo-Json -Compress"
+        return self._json_list(self.execute_command(alias, command, **kwargs))
 
     def get_server_sessions(self, alias: str, **kwargs) -> list:
         """
@@ -201,12 +207,5 @@ class Veeam(ComponentBase):
             List of dictionaries containing server session information including User,
             Server, and Port.
         """
-        command = "Get-VBRServerSession | Select-Object User, Server, Port | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
+        command = "Get-VBRServerSession | Select-Object User, Server, Port | ConvertTo-Json -Compress"
+        return self._json_list(self.execute_command(alias, command, **kwargs))
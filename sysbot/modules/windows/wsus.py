@@ -5,17 +5,23 @@ This module provides methods for managing and querying Windows Server Update
 Services (WSUS) including server configuration, update approvals, computer
 groups, and synchronization using PowerShell WSUS cmdlets.
 """
-from sysbot.utils.engine import ComponentBase
-import json
+from sysbot.utils.engine import ComponentBase, ttl_cache
+from sysbot.utils.helper import Windows
+
+# Server, classification and product results returned with cache=True are at most this old
+CONFIG_TTL = 60
 
 
 class Wsus(ComponentBase):
     """Windows Server Update Services management class using PowerShell WSUS cmdlets."""
 
+    @ttl_cache(CONFIG_TTL, opt_in=True)
     def get_server(self, alias: str, **kwargs) -> dict:
         """
         Get WSUS server information.
 
+        Pass cache=True to accept a result up to 60 seconds old, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
             **kwargs: Additional command execution options.
@@ -24,13 +30,35 @@ class Wsus(ComponentBase):
             Dictionary containing WSUS server details including Name, PortNumber,
             ServerProtocolVersion, and UpdateServer.
         """
-        command = "Get-WsusServer | Select-Object Name, PortNumber, ServerProtocolVersion, UpdateServer | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return {}
-        return json.loads(output)
+        command = "Get-WsusServer | Select-Object Name, PortNumber, ServerProtocolVersion, UpdateServer | ConvertTo-Json -Compress"
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
+
+    @staticmethod
+    def _update_filters(update_id: str, classification: str, approval: str, status: str) -> str:
+        """
+        Build the filtering arguments of Get-WsusUpdate.
+
+        Args:
+            update_id: Update ID to filter by, or None.
+            classification: Classification to filter by, or None.
+            approval: Approval status to filter by, or None.
+            status: Status to filter by, or None.
 
-    def get_update(self, alias: str, update_id: str = None, classification: str = None, approval: str = None, status: str = None, **kwargs) -> list:
+        Returns:
+            The parameter string, empty when no filter is set.
+        """
+        params = []
+        if update_id:
+            params.append(f"-UpdateId {Windows.quote(update_id)}")
+        if classification:
+            params.append(f"-Classification {Windows.quote(classification)}")
+        if approval:
+            params.append(f"-Approval {Windows.quote(approval)}")
+        if status:
+            params.append(f"-Status {Windows.quote(status)}")
+        return " ".join(params)
+
+    def get_update(self, alias: str, update_id: str = None, classification: str = None, approval: str = None, status: str = None, select: list = None, **kwargs) -> list:
         """
         Get WSUS updates with optional filters.
 
@@ -40,32 +68,44 @@ class Wsus(ComponentBase):
             classification: Optional classification to filter by.
             approval: Optional approval status to filter by.
             status: Optional status to filter by.
+            select: Optional properties to return instead of the default ones,
+                e.g. ["UpdateId"].
             **kwargs: Additional command execution options.
 
         Returns:
             List of dictionaries containing update information including Title, UpdateId,
             Classification, Approval, ComputersNeedingThisUpdate, and ComputersInstalledThisUpdate.
         """
-        params = []
-        if update_id:
-            params.append(f"-UpdateId '{update_id}'")
-        if classification:
-            params.append(f"-Classification {classification}")
-        if approval:
-            params.append(f"-Approval {approval}")
-        if status:
-            params.append(f"-Status {status}")
-        
-        param_str = " ".join(params) if params else ""
-        command = f"Get-WsusUpdate {param_str} | Select-Object Title, UpdateId, Classification, Approval, ComputersNeedingThisUpdate, ComputersInstalledThisUpdate | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
+        param_str = self._update_filters(update_id, classification, approval, status)
+        projection = Windows.select(select) if select else " | Select-Object Title, UpdateId, Classification, Approval, ComputersNeedingThisUpdate, ComputersInstalledThisUpdate"
+        command = f"Get-WsusUpdate {param_str}{projection} | ConvertTo-Json -Compress"
+        return self._json_list(self.execute_command(alias, command, **kwargs))
+
+    def iter_update(self, alias: str, update_id: str = None, classification: str = None, approval: str = None, status: str = None, **kwargs):
+        """
+        Iterate over WSUS updates with optional filters, one update at a time.
+
+        PowerShell serializes each update on its own line, so large update
+        catalogs are decoded incrementally and the caller can stop early.
+
+        Args:
+            alias: Session alias for the connection.
+            update_id: Optional update ID to filter by.
+            classification: Optional classification to filter by.
+            approval: Optional approval status to filter by.
+            status: Optional status to filter by.
+            **kwargs: Additional command execution options.
+
+        Yields:
+            Dictionaries containing update information including Title, UpdateId,
+            Classification, Approval, ComputersNeedingThisUpdate, and ComputersInstalledThisUpdate.
+        """
+        param_str = self._update_filters(update_id, classification, approval, status)
+        command = (
+            f"Get-WsusUpdate {param_str} | Select-Object Title, UpdateId, Classification, Approval, "
+            "ComputersNeedingThisUpdate, ComputersInstalledThisUpdate | ForEach-Object { $_ | ConvertTo-Json -Compress }"
+        )
+        yield from self._iter_json_lines(self.execute_command(alias, command, **kwargs))
 
     def get_computer(self, alias: str, computer_name: str = None, **kwargs) -> list:
         """
@@ -82,23 +122,19 @@ class Wsus(ComponentBase):
         """
         params = []
         if computer_name:
-            params.append(f"-ComputerTargetName '{computer_name}'")
+            params.append(f"-ComputerTargetName {Windows.quote(computer_name)}")
         
         param_str = " ".join(params) if params else ""
-        command = f"Get-WsusComputer {param_str} | Select-Object FullDomainName, IPAddress, LastReportedStatusTime, LastSyncTime, OSDescription | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
+        command = f"Get-WsusComputer {param_str} | Select-Object FullDomainName, IPAddress, LastReportedStatusTime, LastSyncTime, OSDescription | ConvertTo-Json -Compress"
+        return self._json_list(self.execute_command(alias, command, **kwargs))
 
+    @ttl_cache(CONFIG_TTL, opt_in=True)
     def get_classification(self, alias: str, **kwargs) -> list:
         """
         Get available update classifications.
 
+        Pass cache=True to accept a result up to 60 seconds old, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
             **kwargs: Additional command execution options.
@@ -106,20 +142,16 @@ class Wsus(ComponentBase):
         Returns:
             List of dictionaries containing classification information including Classification and Id.
         """
-        command = "Get-WsusClassification | Select-Object Classification, Id | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
+        command = "Get-WsusClassification | Select-Object Classification, Id | ConvertTo-Json -Compress"
+        return self._json_list(self.execute_command(alias, command, **kwargs))
 
+    @ttl_cache(CONFIG_TTL, opt_in=True)
     def get_product(self, alias: str, **kwargs) -> list:
         """
         Get available products for updates.
 
+        Pass cache=True to accept a result up to 60 seconds old, see ttl_cache.
+
         Args:
             alias: Session alias for the connection.
             **kwargs: Additional command execution options.
@@ -127,15 +159,8 @@ class Wsus(ComponentBase):
         Returns:
             List of dictionaries containing product information including Product and Id.
         """
-        command = "Get-WsusProduct | Select-Object Product, Id | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return []
-        result = json.loads(output)
-        # Wrap single objects in a list
-        if isinstance(result, dict):
-            return [result]
-        return result
+        command = "Get-WsusProduct | Select-Object Product, Id | ConvertTo-Json -Compress"
+        return self._json_list(self.execute_command(alias, command, **kwargs))
 
     def get_status(self, alias: str, **kwargs) -> dict:
         """
@@ -148,8 +173,5 @@ class Wsus(ComponentBase):
         Returns:
             Dictionary containing WSUS server statistics and status information.
         """
-        command = "Get-WsusServer | Get-WsusServerStatistics | ConvertTo-Json"
-        output = self.execute_command(alias, command, **kwargs)
-        if not output or output.strip() == "":
-            return {}
-        return json.loads(output)
+        command = "Get-WsusServer | Get-WsusServerStatistics | ConvertTo-Json -Compress"
+        return self._json_dict(self.execute_command(alias, command, **kwargs))
@@ -23,17 +23,137 @@ SOFTWARE.
 """
 
 import base64
+import copy
+import csv
+import io
 import os
 import json
+import time
+import functools
+import threading
 import importlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
 from sshtunnel import SSHTunnelForwarder
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Dict, Optional, Union, List
 from cryptography.fernet import Fernet
 
+# Optional accelerated JSON decoders, preferred over the stdlib when installed
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+try:
+    import simdjson
+    HAS_SIMDJSON = True
+except ImportError:
+    HAS_SIMDJSON = False
+    simdjson = None
+
+
+if HAS_SIMDJSON:
+    # A simdjson.Parser owns reusable parse buffers but must not be shared
+    # between threads, so keep one per thread
+    _simdjson_local = threading.local()
+
+    def _simdjson_parser():
+        parser = getattr(_simdjson_local, "parser", None)
+        if parser is None:
+            parser = _simdjson_local.parser = simdjson.Parser()
+        return parser
+
+if HAS_ORJSON:
+    json_loads = orjson.loads
+elif HAS_SIMDJSON:
+
+    def json_loads(data):
+        return _simdjson_parser().parse(data, True)
+else:
+    json_loads = json.loads
+
+
+def json_pointer(data, pointer: str, default: Any = None) -> Any:
+    """
+    Extract a single value from a JSON document using a JSON pointer (RFC 6901).
+
+    With pysimdjson installed only the path leading to the value is decoded,
+    the rest of the document is skipped. Otherwise the document is fully
+    parsed and walked. A document already parsed by json_lazy can be passed
+    to look up several pointers without parsing it again.
+
+    Args:
+        data: JSON document as str or bytes, or as returned by json_lazy.
+        pointer: JSON pointer to the value (e.g. "/value/state"), "" for the root.
+        default: Value returned when the pointer does not resolve.
+
+    Returns:
+        The referenced value converted to plain Python objects, or default.
+    """
+    if isinstance(data, (str, bytes, bytearray, memoryview)):
+        data = _simdjson_parser().parse(data) if HAS_SIMDJSON else json_loads(data)
+
+    if HAS_SIMDJSON and isinstance(data, (simdjson.Object, simdjson.Array)):
+        try:
+            value = data.at_pointer(pointer)
+        except (LookupError, TypeError, ValueError):
+            return default
+        if isinstance(value, simdjson.Object):
+            return value.as_dict()
+        if isinstance(value, simdjson.Array):
+            return value.as_list()
+        return value
+
+    value = data
+    if not pointer:
+        return value
+    for token in pointer[1:].split("/"):
+        token = token.replace("~1", "/").replace("~0", "~")
+        try:
+            if isinstance(value, dict):
+                value = value[token]
+            elif isinstance(value, list):
+                value = value[int(token)]
+            else:
+                return default
+        except (LookupError, TypeError, ValueError):
+            return default
+    return value
+
+
+def json_lazy(data) -> Any:
+    """
+    Parse a JSON document without materialising it.
+
+    With pysimdjson installed, objects and arrays are returned as read-only
+    simdjson proxies: fields are decoded when accessed and untouched fields
+    cost nothing. Proxies are not JSON serialisable and not plain dicts, call
+    as_dict() / as_list() on them when a real container is needed. Each call
+    uses its own parser so returned proxies stay valid for as long as they
+    are referenced. Without pysimdjson the document is fully decoded.
+
+    Args:
+        data: JSON document as str or bytes.
+
+    Returns:
+        The parsed document, as proxies when possible.
+    """
+    if HAS_SIMDJSON:
+        return simdjson.Parser().parse(data)
+    return json_loads(data)
+
 
 class ConnectorInterface(ABC):
+    # Whether one session may run several commands at the same time. Shell
+    # based sessions (WinRM shell, SSH channel, PSRP runspace) are not, so
+    # Sysbot runs their commands one at a time per session
+    THREAD_SAFE = False
+
     def __init__(self):
         self._cache = None
 
@@ -63,9 +183,92 @@ class ComponentGroup:
         self.name = name
 
 
+_URL_SAFE_SEGMENT = re.compile(r"[A-Za-z0-9._~-]+")
+
+
+def url_segment(value) -> str:
+    """
+    Render a value as a single URL path segment.
+
+    Identifiers made of unreserved characters (UUIDs, numeric or dashed IDs)
+    are returned as-is; anything else is percent-encoded, including '/'.
+
+    Args:
+        value: Identifier to place in the URL path.
+
+    Returns:
+        The path segment.
+    """
+    value = str(value)
+    if _URL_SAFE_SEGMENT.fullmatch(value):
+        return value
+    return quote(value, safe="")
+
+
+# Maximum number of cached results kept by one component instance
+TTL_CACHE_MAXSIZE = 256
+
+
+def ttl_cache(seconds: float, opt_in: bool = False):
+    """
+    Cache the result of a component getter for a limited time.
+
+    Results are stored per component instance and keyed by method name, alias
+    and call arguments, so repeated calls within the TTL window skip both the
+    remote command and the response decoding. Calls with unhashable arguments
+    are never cached. Every call returns its own deep copy of the cached
+    result, so callers may modify it freely. Expired results are evicted once
+    a component holds TTL_CACHE_MAXSIZE of them, then the oldest ones, and
+    Sysbot drops the results of an alias whenever its session is opened or
+    closed.
+
+    The decorated getter accepts two extra keyword options:
+
+    - cache: use the cache for this call. Defaults to True, or to False for
+      opt_in getters, so that those read the live state unless asked not to.
+    - fresh: ignore a cached result and store the new one instead.
+
+    Args:
+        seconds: Time to live of a cached result, in seconds.
+        opt_in: Only use the cache for calls passing cache=True, for getters
+            whose result is checked right after the state it reflects was
+            changed (default: False).
+
+    Returns:
+        The decorator to apply to a ComponentBase method taking alias first.
+    """
+
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(self, alias, *args, fresh=False, **kwargs):
+            if not kwargs.pop("cache", not opt_in):
+                return function(self, alias, *args, **kwargs)
+            key = (function.__name__, alias, args, frozenset(kwargs.items()))
+            try:
+                hash(key)
+            except TypeError:
+                return function(self, alias, *args, **kwargs)
+            now = time.monotonic()
+            if not fresh:
+                entry = self._ttl_cache.get(key)
+                if entry is not None and entry[0] > now:
+                    return copy.deepcopy(entry[1])
+            value = function(self, alias, *args, **kwargs)
+            if len(self._ttl_cache) >= TTL_CACHE_MAXSIZE:
+                self._prune_cache(now)
+            self._ttl_cache[key] = (now + seconds, value)
+            return copy.deepcopy(value)
+
+        wrapper.ttl_cached = True
+        return wrapper
+
+    return decorator
+
+
 class ComponentBase:
     def __init__(self):
         self._sysbot = None
+        self._ttl_cache = {}
 
     def set_sysbot_instance(self, sysbot_instance):
         self._sysbot = sysbot_instance
@@ -75,6 +278,224 @@ class ComponentBase:
             raise RuntimeError("No Sysbot instance available")
         return self._sysbot.execute_command(alias, command, **kwargs)
 
+    def invalidate_cache(self, alias: str = None, method: str = None) -> None:
+        """
+        Drop cached getter results of this component.
+
+        Args:
+            alias: Only drop the results of this session alias. If None, drop
+                the results of every alias.
+            method: Only drop the results of this getter (e.g. "get_ca"). If
+                None, drop the results of every getter.
+        """
+        if alias is None and method is None:
+            self._ttl_cache.clear()
+            return
+        # Snapshot the keys, gather worker threads may be adding entries
+        for key in list(self._ttl_cache):
+            if (alias is None or key[1] == alias) and (method is None or key[0] == method):
+                self._ttl_cache.pop(key, None)
+
+    def _prune_cache(self, now: float) -> None:
+        """
+        Make room in the getter cache of this component.
+
+        Expired results are dropped first, then the oldest ones until the
+        cache is below TTL_CACHE_MAXSIZE.
+
+        Args:
+            now: Current time.monotonic() value.
+        """
+        keys = list(self._ttl_cache)
+        for key in keys:
+            entry = self._ttl_cache.get(key)
+            if entry is not None and entry[0] <= now:
+                self._ttl_cache.pop(key, None)
+        excess = len(self._ttl_cache) - TTL_CACHE_MAXSIZE + 1
+        if excess > 0:
+            for key in list(self._ttl_cache)[:excess]:
+                self._ttl_cache.pop(key, None)
+
+    @staticmethod
+    def _run_concurrently(function, arguments, max_workers=8):
+        """
+        Call a function once per argument on a thread pool.
+
+        Remote calls spend most of their time waiting on the network, so
+        running independent requests concurrently bounds the wall-clock time
+        by the slowest request instead of the sum of all of them.
+
+        Args:
+            function: Callable taking a single argument.
+            arguments: Iterable of arguments, one call per item.
+            max_workers: Maximum number of concurrent calls (default: 8).
+
+        Returns:
+            List of results in the same order as arguments.
+        """
+        arguments = list(arguments)
+        if not arguments:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(arguments))) as executor:
+            return list(executor.map(function, arguments))
+
+    @staticmethod
+    def _json_list(output) -> list:
+        """
+        Decode command output expected to hold a list of objects.
+
+        PowerShell serializes a single-item pipeline as a bare object, such
+        results are wrapped in a list.
+
+        Args:
+            output: Command output, as str or bytes.
+
+        Returns:
+            The decoded list, empty for a blank output.
+        """
+        if not output or output.isspace():
+            return []
+        result = json_loads(output)
+        return [result] if isinstance(result, dict) else result
+
+    @staticmethod
+    def _json_dict(output) -> dict:
+        """
+        Decode command output expected to hold a single object.
+
+        Args:
+            output: Command output, as str or bytes.
+
+        Returns:
+            The decoded object, empty for a blank output.
+        """
+        if not output or output.isspace():
+            return {}
+        return json_loads(output)
+
+    @staticmethod
+    def _csv_list(output) -> list:
+        """
+        Decode ConvertTo-Csv output into a list of rows.
+
+        Args:
+            output: Command output with a header line, as str or bytes.
+
+        Returns:
+            One dictionary per row keyed by column name, all values being
+            strings, empty for a blank output.
+        """
+        if isinstance(output, bytes):
+            output = output.decode("utf-8-sig")
+        return list(csv.DictReader(io.StringIO(output)))
+
+    @staticmethod
+    def _iter_json_lines(output):
+        """
+        Decode newline-delimited JSON one record at a time.
+
+        Args:
+            output: Command output with one JSON document per line, as str
+                or bytes.
+
+        Yields:
+            Each decoded document, blank lines are skipped.
+        """
+        if not output:
+            return
+        for line in output.splitlines():
+            if line and not line.isspace():
+                yield json_loads(line)
+
+    def gather(self, alias: str, method_names: list, max_workers: int = 4, **kwargs) -> dict:
+        """
+        Call several getters of this component concurrently on one session.
+
+        Each getter still runs its own remote command and decodes its response
+        on a worker thread. Sessions whose connector is not thread-safe (WinRM,
+        SSH, PSRP) run one command at a time, so on those the commands are
+        serialized by Sysbot and only cache hits and decoding overlap; HTTP
+        sessions run the commands in parallel. To overlap commands on shell
+        based connectors, query several sessions with gather_hosts.
+
+        Args:
+            alias: Session alias for the connection.
+            method_names: Names of getters taking only alias and keyword
+                options, e.g. ["get_users", "get_computers"].
+            max_workers: Maximum number of concurrent commands (default: 4).
+            **kwargs: Additional command execution options passed to every
+                getter. fresh and cache are only passed to cached getters.
+
+        Returns:
+            Dictionary mapping each method name to its result.
+
+        Raises:
+            ValueError: If a name is not a public method of this component.
+        """
+        invalid = [
+            name
+            for name in method_names
+            if name.startswith("_") or not callable(getattr(self, name, None))
+        ]
+        if invalid:
+            raise ValueError(f"Unknown methods for {type(self).__name__}: {', '.join(invalid)}")
+        results = self._run_concurrently(
+            lambda name: self._call_getter(getattr(self, name), alias, kwargs),
+            method_names,
+            max_workers,
+        )
+        return dict(zip(method_names, results))
+
+    @staticmethod
+    def _call_getter(method, alias, kwargs):
+        """
+        Call a getter, dropping the fresh and cache options if it is not cached.
+
+        Args:
+            method: Bound getter taking alias first.
+            alias: Session alias for the connection.
+            kwargs: Arguments and command execution options.
+
+        Returns:
+            The getter result.
+        """
+        if not getattr(method, "ttl_cached", False):
+            kwargs = {key: value for key, value in kwargs.items() if key not in ("fresh", "cache")}
+        return method(alias, **kwargs)
+
+    def gather_hosts(self, aliases: list, method_name: str, max_workers: int = 8, **kwargs) -> dict:
+        """
+        Call one getter of this component concurrently on several sessions.
+
+        Commands on different sessions always run in parallel. A failing
+        session does not stop the others, its entry holds the exception it
+        raised instead of a result.
+
+        Args:
+            aliases: Session aliases to query.
+            method_name: Name of a public method taking alias first, e.g. "bulk".
+            max_workers: Maximum number of concurrent commands (default: 8).
+            **kwargs: Arguments and command execution options passed to every call.
+
+        Returns:
+            Dictionary mapping each alias to its result or exception.
+
+        Raises:
+            ValueError: If method_name is not a public method of this component.
+        """
+        if method_name.startswith("_") or not callable(getattr(self, method_name, None)):
+            raise ValueError(f"Unknown method for {type(self).__name__}: {method_name}")
+        method = getattr(self, method_name)
+
+        def call(alias):
+            try:
+                return self._call_getter(method, alias, kwargs)
+            except Exception as error:
+                return error
+
+        results = self._run_concurrently(call, aliases, max_workers)
+        return dict(zip(aliases, results))
+
 
 class ComponentLoader:
     @staticmethod
@@ -137,6 +558,8 @@ class ComponentLoader:
     def create_hierarchy(sysbot_instance, component_full_path, component_instance):
         if hasattr(component_instance, "set_sysbot_instance"):
             component_instance.set_sysbot_instance(sysbot_instance)
+        if hasattr(component_instance, "invalidate_cache"):
+            sysbot_instance._components.append(component_instance)
 
         parts = component_full_path.split(".")
         current_obj = sysbot_instance
@@ -5,17 +5,155 @@ This module provides various helper classes and utility functions for SysBot,
 including Windows CIM helpers, timezone conversion utilities, and security-related
 operations such as certificate information retrieval.
 """
+import base64
 import datetime
+import gzip
+import re
 import socket
 import ssl
 import pytz
 from OpenSSL import crypto
 
 
+# PowerShell ends a single-quoted string on any of these quote characters,
+# doubling them is the only escape
+_POWERSHELL_QUOTES = str.maketrans(
+    {quote: quote * 2 for quote in ("'", "\u2018", "\u2019", "\u201a", "\u201b")}
+)
+
+# Property names accepted by property_list(), anything else could alter the
+# pipeline. Inner hyphens are allowed for AD attributes such as msDS-Principal
+_POWERSHELL_PROPERTY = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*")
+
+# Make powershell.exe write UTF-8 without BOM to stdout instead of the OEM
+# code page, so the raw bytes returned can be handed straight to a JSON parser
+UTF8_OUTPUT_PREAMBLE = "[Console]::OutputEncoding = [Text.UTF8Encoding]::new($false); "
+
+
 class Windows:
+    @staticmethod
+    def quote(value) -> str:
+        """
+        Render a value as a PowerShell single-quoted string literal.
+
+        Args:
+            value: Value to embed in a PowerShell command.
+
+        Returns:
+            The quoted literal, safe against quote injection.
+        """
+        return "'" + str(value).translate(_POWERSHELL_QUOTES) + "'"
+
+    @staticmethod
+    def property_list(fields) -> str:
+        """
+        Render property names as a comma-separated PowerShell argument.
+
+        Args:
+            fields: Property names.
+
+        Returns:
+            The names joined with commas.
+
+        Raises:
+            ValueError: If a field is not a plain property name.
+        """
+        invalid = [field for field in fields if not _POWERSHELL_PROPERTY.fullmatch(str(field))]
+        if invalid:
+            raise ValueError(f"Invalid property names: {', '.join(map(str, invalid))}")
+        return ",".join(fields)
+
+    @staticmethod
+    def select(fields) -> str:
+        """
+        Build a Select-Object stage trimming objects before serialization.
+
+        Args:
+            fields: Property names to keep, or None to keep all of them.
+
+        Returns:
+            The pipeline stage starting with " | ", empty when fields is None.
+
+        Raises:
+            ValueError: If a field is not a plain property name.
+        """
+        if fields is None:
+            return ""
+        return " | Select-Object " + Windows.property_list(fields)
+
+    @staticmethod
+    def bulk_command(expressions: dict, keys: list, depth) -> str:
+        """
+        Build a script returning several PowerShell expressions as one JSON object.
+
+        Args:
+            expressions: Mapping of result key to PowerShell expression.
+            keys: Keys of the expressions to evaluate, in output order.
+            depth: ConvertTo-Json depth, including the wrapping object level.
+                A dictionary mapping each key to the depth of its own value
+                serializes every expression separately, for results that must
+                match getters using different depths.
+
+        Returns:
+            The PowerShell command.
+
+        Raises:
+            ValueError: If a key is not in expressions.
+        """
+        unknown = [key for key in keys if key not in expressions]
+        if unknown:
+            raise ValueError(
+                f"Unsupported bulk keys: {', '.join(unknown)}. "
+                f"Valid keys are: {', '.join(expressions)}"
+            )
+        if isinstance(depth, dict):
+            entries = ", ".join(
+                f"'\"{key}\":' + (ConvertTo-Json -Compress -Depth {depth[key]} "
+                f"-InputObject ({expressions[key]}))"
+                for key in keys
+            )
+            return f"'{{' + (@({entries}) -join ',') + '}}'"
+        entries = "; ".join(f"{key} = {expressions[key]}" for key in keys)
+        return f"[ordered]@{{ {entries} }} | ConvertTo-Json -Depth {depth} -Compress"
+
+    @staticmethod
+    def gzip_command(command: str) -> str:
+        """
+        Wrap a text-producing command so its output is gzipped and base64 encoded.
+
+        JSON or CSV typically shrinks by an order of magnitude, which pays off
+        when a large result has to travel over WinRM or SSH. Decode the output
+        with gunzip_output.
+
+        Args:
+            command: PowerShell command writing JSON or lines of text.
+
+        Returns:
+            The wrapped PowerShell command.
+        """
+        return (
+            f"$text = {command}; $buffer = New-Object IO.MemoryStream; "
+            "$gzip = New-Object IO.Compression.GZipStream($buffer, [IO.Compression.CompressionMode]::Compress); "
+            "$writer = New-Object IO.StreamWriter($gzip); $writer.Write((@($text) -join \"`n\")); $writer.Close(); "
+            "[Convert]::ToBase64String($buffer.ToArray())"
+        )
+
+    @staticmethod
+    def gunzip_output(output) -> bytes:
+        """
+        Decode the output of a command wrapped by gzip_command.
+
+        Args:
+            output: Base64 text returned by the connector, as str or bytes.
+
+        Returns:
+            The original UTF-8 text, as bytes.
+        """
+        return gzip.decompress(base64.b64decode(output))
+
     @staticmethod
     def get_cim_class(namespace: str, classname: str, property: str) -> dict:
-        return f"Get-CimInstance -Namespace {namespace} -ClassName {classname} | Select-Object {property} | ConvertTo-Json"
+        return f"Get-CimInstance -Namespace {namespace} -ClassName {classname} | Select-Object {property} | ConvertTo-Json -Compress"
 
 
 class Timezone: